@@ -1,13 +1,42 @@
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, g, jsonify, render_template, request, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
+import argparse
+import atexit
+import base64
+import gzip
+import hashlib
 import os
+import queue
+import random
+import re
+import sys
+import sqlite3
+import struct
+import tempfile
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import mmap
 import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
+try:
+    import fcntl  # POSIX only; without it single-flight coalescing stays within one process
+except ImportError:
+    fcntl = None
+
+try:
+    import brotli  # Optional; responses fall back to gzip without it
+except ImportError:
+    brotli = None
+
 # Load environment variables from .env if running locally
 load_dotenv()
 
@@ -15,8 +44,76 @@ load_dotenv()
 app = Flask(__name__, template_folder='templates')
 CORS(app)
 
-# Configure logging to output timestamp, log level, and message
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging settings: LOG_LEVEL sets the level, LOG_FORMAT=json writes one JSON object per record,
+# LOG_DEBUG_SAMPLE_RATE is the fraction of events whose per-event DEBUG trace from the
+# arbitrage engine is kept when DEBUG is enabled, and LOG_ARBS=1 keeps the per-arb DEBUG records
+# of the arby.arbs logger at any LOG_LEVEL
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', '0.01'))
+LOG_ARBS = os.getenv('LOG_ARBS', '0') == '1'
+
+# One JSON object per line; arb records carry the full arb under 'arb'
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        arb = getattr(record, 'arb', None)
+        if arb is not None:
+            payload['arb'] = arb
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+# Queue handler that leaves formatting to the listener thread. The stock QueueHandler formats
+# in the logging thread; records here only reference values that are not mutated afterwards.
+class DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# Route every record through a queue to a listener thread that formats and writes it, so request
+# and engine threads never block on handler I/O. Like basicConfig, an already configured root
+# logger is left alone.
+def configure_logging() -> QueueListener:
+    level = logging.getLevelName(LOG_LEVEL)
+    if not isinstance(level, int):
+        level = logging.INFO
+    handler = logging.StreamHandler()
+    if LOG_FORMAT == 'json':
+        handler.setFormatter(JsonLogFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    logging.basicConfig(level=level, handlers=[DeferredQueueHandler(log_queue)])
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Forked workers (e.g. gunicorn --preload) inherit the queue but not the listener thread,
+    # so each child starts its own listener on the same queue and handler
+    def start_child_listener():
+        global log_listener
+        log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        log_listener.start()
+        atexit.register(log_listener.stop)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=start_child_listener)
+    return listener
+
+log_listener = configure_logging()
+
+# Per-event DEBUG traces of the arbitrage engine (sampled) and one structured DEBUG record per
+# arb found. Scans log a single INFO summary: a record per arb made INFO logging a large share
+# of engine time.
+engine_log = logging.getLogger('arby.engine')
+arb_log = logging.getLogger('arby.arbs')
+if LOG_ARBS:
+    arb_log.setLevel(logging.DEBUG)
 
 # Retrieve API key from environment variables
 API_KEY = os.getenv('ODDS_API_KEY')
@@ -25,9 +122,76 @@ API_KEY = os.getenv('ODDS_API_KEY')
 logging.info(f"API Key Loaded: {'Yes' if API_KEY else 'No'}")
 
 # Constants for API interaction
-BASE_URL = "https://api.the-odds-api.com/v4"
+BASE_URL = os.getenv('ODDS_API_BASE_URL', "https://api.the-odds-api.com/v4")  # Overridable for local stand-ins
 DEFAULT_REGIONS = ["eu", "us", "au", "uk"]  # Default regions to get odds for
 
+# Maximum number of concurrent upstream requests during a scan
+MAX_FETCH_WORKERS = int(os.getenv('ODDS_API_MAX_WORKERS', '8'))
+
+# Timeout (seconds) applied to every upstream request
+REQUEST_TIMEOUT = float(os.getenv('ODDS_API_TIMEOUT', '15'))
+
+# Shared HTTP session so all upstream calls reuse pooled keep-alive connections
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_FETCH_WORKERS))
+http_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_FETCH_WORKERS))
+
+# Rate governor settings: optional request pacing, 429 retries and a quota reserve. Pacing is off
+# by default (the fan-out is bounded by MAX_FETCH_WORKERS and 429s are retried); set
+# ODDS_API_RATE to the plan's requests per second to pace odds calls client-side.
+ODDS_API_RATE = float(os.getenv('ODDS_API_RATE', '0'))  # Requests per second, 0 disables pacing
+ODDS_API_BURST = float(os.getenv('ODDS_API_BURST', str(MAX_FETCH_WORKERS)))
+ODDS_API_MAX_RETRIES = int(os.getenv('ODDS_API_MAX_RETRIES', '3'))
+ODDS_API_BACKOFF_BASE = float(os.getenv('ODDS_API_BACKOFF_BASE', '1'))
+ODDS_API_BACKOFF_CAP = float(os.getenv('ODDS_API_BACKOFF_CAP', '30'))
+ODDS_API_QUOTA_RESERVE = int(os.getenv('ODDS_API_QUOTA_RESERVE', '0'))  # Quota units never spent on odds refreshes
+
+# Response cache settings: the sports list rarely changes, odds go stale within seconds
+SPORTS_CACHE_TTL = float(os.getenv('SPORTS_CACHE_TTL', str(6 * 60 * 60)))
+ODDS_CACHE_TTL = float(os.getenv('ODDS_CACHE_TTL', '30'))
+EVENT_CALENDAR_TTL = float(os.getenv('EVENT_CALENDAR_TTL', str(30 * 60)))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+
+# Background odds poller: ODDS_POLLER=1 runs it inside the web process; `python app.py poller`
+# runs it standalone. Either way one writer publishes snapshots to ODDS_SNAPSHOT_FILE, which every
+# web worker memory-maps, so workers share one copy of the snapshot instead of holding their own
+POLLER_ENABLED = os.getenv('ODDS_POLLER', '0') == '1'
+POLLER_REGIONS = [r.strip() for r in os.getenv('ODDS_POLLER_REGIONS', ','.join(DEFAULT_REGIONS)).split(',') if r.strip()]
+SNAPSHOT_FILE = os.getenv('ODDS_SNAPSHOT_FILE')
+POLL_TICK = float(os.getenv('POLL_TICK', '1'))
+POLL_SOON_WINDOW = float(os.getenv('POLL_SOON_WINDOW', str(60 * 60)))  # Events starting within this are polled as live
+POLL_INTERVAL_LIVE = float(os.getenv('POLL_INTERVAL_LIVE', '60'))
+POLL_INTERVAL_NEAR = float(os.getenv('POLL_INTERVAL_NEAR', str(5 * 60)))
+POLL_INTERVAL_FAR = float(os.getenv('POLL_INTERVAL_FAR', str(30 * 60)))
+POLL_INTERVAL_IDLE = float(os.getenv('POLL_INTERVAL_IDLE', str(60 * 60)))
+POLL_RETRY_INTERVAL = float(os.getenv('POLL_RETRY_INTERVAL', '60'))
+# Minimum time between two polled snapshots saved to the snapshot store (every refresh republishes all sports)
+POLL_PERSIST_INTERVAL = float(os.getenv('POLL_PERSIST_INTERVAL', str(5 * 60)))
+ARB_CHANGES_BUFFER = int(os.getenv('ARB_CHANGES_BUFFER', '1000'))  # Recent arb diffs kept for /api/arb_changes
+
+# Directory of the lock and result files used to coalesce identical live scans across
+# gunicorn workers on one host (set SINGLE_FLIGHT_DIR to an empty string to coalesce per process only)
+SINGLE_FLIGHT_DIR = os.getenv('SINGLE_FLIGHT_DIR', os.path.join(tempfile.gettempdir(), 'arby-single-flight'))
+
+# Arb list responses: sorted results are kept per data version and filter set for conditional
+# GETs and follow-up pages; JSON bodies of at least COMPRESS_MIN_SIZE bytes are compressed
+ARBS_RESPONSE_CACHE_TTL = float(os.getenv('ARBS_RESPONSE_CACHE_TTL', '15'))
+ARBS_RESPONSE_CACHE_MAX_BYTES = int(os.getenv('ARBS_RESPONSE_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', '6'))
+
+# Observability: Prometheus metrics are served at /metrics. ARBY_PROFILING=1 enables
+# /api/profile_scan, which runs one scan under a sampling profiler
+PROFILING_ENABLED = os.getenv('ARBY_PROFILING', '0') == '1'
+PROFILE_SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005'))
+
+# Markets requested in one batched odds call per sport. Each market costs one quota unit per
+# region; spreads and totals are evaluated per line next to h2h
+ODDS_MARKETS = [m.strip() for m in os.getenv('ODDS_MARKETS', 'h2h,spreads,totals').split(',') if m.strip()]
+# Configured markets whose outcomes are evaluated per line. Exchange lay markets (h2h_lay) and
+# any other market are dropped at normalization: a lay price is not a back bet on an outcome.
+LINE_MARKETS = frozenset(m for m in ODDS_MARKETS if m in ('spreads', 'totals'))
+
 # Mapping of human-readable regions to API expected region codes
 REGION_MAPPING = {
     'eu': 'eu',
@@ -61,6 +225,502 @@ class AuthenticationException(APIException):
 class RateLimitException(APIException):
     pass
 
+# Thread-safe LRU cache with per-entry TTLs, bounded by the approximate size of the cached payloads,
+# by the number of entries, or both (a limit left as None is not enforced)
+class TTLCache:
+    def __init__(self, max_bytes: int = None, max_entries: int = None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, value = entry
+            if expires_at <= time.monotonic():
+                # Expired entries count as misses and are dropped eagerly
+                del self._entries[key]
+                self.current_bytes -= size
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: float, size: int = 0):
+        if ttl <= 0 or (self.max_bytes is not None and size > self.max_bytes) or self.max_entries == 0:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self.current_bytes += size
+            # Evict least recently used entries until we are back under the memory and entry caps
+            while self._entries and ((self.max_bytes is not None and self.current_bytes > self.max_bytes)
+                                     or (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+# Shared cache for upstream responses from get_sports and get_data
+response_cache = TTLCache(max_bytes=RESPONSE_CACHE_MAX_BYTES)
+
+# Coalesces concurrent calls with the same key into one execution whose result every caller receives.
+# Threads of one process wait on the leader's event; other processes on the host wait on an exclusive
+# flock of a per-key lock file and then read the JSON result the leader wrote next to it. Results
+# shared across processes must therefore be JSON serializable.
+class SingleFlight:
+    class _Call:
+        __slots__ = ('done', 'result', 'error')
+
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self, lock_dir: str = None):
+        self.lock_dir = lock_dir if lock_dir and fcntl is not None else None
+        if self.lock_dir:
+            os.makedirs(self.lock_dir, exist_ok=True)
+        self.executed = 0
+        self.shared_in_process = 0
+        self.shared_across_processes = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: tuple, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = SingleFlight._Call()
+            else:
+                self.shared_in_process += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = self._run_exclusive(key, fn)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    # Run fn while holding the key's lock file, or reuse the result of another process that held it
+    def _run_exclusive(self, key: tuple, fn):
+        if self.lock_dir is None:
+            return self._execute(fn)
+        digest = hashlib.sha1(json.dumps(key).encode()).hexdigest()
+        lock_path = os.path.join(self.lock_dir, f"{digest}.lock")
+        result_path = os.path.join(self.lock_dir, f"{digest}.json")
+        requested_at = time.time()
+        with open(lock_path, 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Another worker is already running this call: wait for it to finish and take its result
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                found, result = self._read_result(result_path, requested_at)
+                if found:
+                    with self._lock:
+                        self.shared_across_processes += 1
+                    return result
+            try:
+                result = self._execute(fn)
+                self._write_result(result_path, result)
+                return result
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _execute(self, fn):
+        with self._lock:
+            self.executed += 1
+        return fn()
+
+    # Results written before this caller arrived belong to an earlier call and are not reused
+    @staticmethod
+    def _read_result(path: str, requested_at: float):
+        try:
+            with open(path, 'r') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        if payload.get('written_at', 0) < requested_at:
+            return False, None
+        return True, payload.get('result')
+
+    @staticmethod
+    def _write_result(path: str, result):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'written_at': time.time(), 'result': result}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logging.error(f"Failed to share single-flight result at {path}: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'executed': self.executed,
+                'shared_in_process': self.shared_in_process,
+                'shared_across_processes': self.shared_across_processes,
+            }
+
+# Thread-safe counter, gauge or histogram rendered in the Prometheus text exposition format.
+# Label values are passed as keyword arguments named after `labelnames`.
+class Metric:
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, name: str, help: str, kind: str, labelnames: tuple = (), buckets: tuple = None):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets or Metric.DEFAULT_BUCKETS) if kind == 'histogram' else ()
+        self._values = {}  # label values -> value, or [bucket counts..., sum, count] for histograms
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def inc(self, value: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @staticmethod
+    def _format_labels(pairs: list) -> str:
+        if not pairs:
+            return ''
+        escaped = []
+        for name, value in pairs:
+            value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            escaped.append(f'{name}="{value}"')
+        return '{' + ','.join(escaped) + '}'
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted((key, list(value) if isinstance(value, list) else value) for key, value in self._values.items())
+        for key, value in items:
+            pairs = list(zip(self.labelnames, key))
+            if self.kind != 'histogram':
+                lines.append(f"{self.name}{self._format_labels(pairs)} {value}")
+                continue
+            for bound, count in zip(self.buckets, value):
+                lines.append(f"{self.name}_bucket{self._format_labels(pairs + [('le', str(bound))])} {count}")
+            lines.append(f"{self.name}_bucket{self._format_labels(pairs + [('le', '+Inf')])} {value[-1]}")
+            lines.append(f"{self.name}_sum{self._format_labels(pairs)} {value[-2]}")
+            lines.append(f"{self.name}_count{self._format_labels(pairs)} {value[-1]}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def _register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple = ()) -> Metric:
+        return self._register(Metric(name, help, 'counter', labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: tuple = ()) -> Metric:
+        return self._register(Metric(name, help, 'gauge', labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = None) -> Metric:
+        return self._register(Metric(name, help, 'histogram', labelnames, buckets))
+
+    def render(self) -> str:
+        return '\n'.join(line for metric in self._metrics for line in metric.render()) + '\n'
+
+# Hot-path metrics exposed at /metrics
+metrics = MetricsRegistry()
+upstream_request_seconds = metrics.histogram('arby_upstream_request_seconds', 'Latency of odds API requests.', ('endpoint', 'sport'))
+upstream_response_bytes = metrics.counter('arby_upstream_response_bytes_total', 'Bytes received from the odds API.', ('endpoint', 'sport'))
+upstream_responses = metrics.counter('arby_upstream_responses_total', 'Odds API responses by status code (error when no response arrived).', ('endpoint', 'status'))
+odds_quota_remaining = metrics.gauge('arby_odds_quota_remaining', 'Odds API quota remaining, from the latest response headers.')
+odds_quota_used = metrics.gauge('arby_odds_quota_used', 'Odds API quota used, from the latest response headers.')
+arb_engine_seconds = metrics.histogram('arby_arb_engine_seconds', 'Time spent computing arbs per engine run.')
+arb_engine_matches = metrics.counter('arby_arb_engine_matches_total', 'Matches evaluated by the arbitrage engine.')
+arb_engine_matches_per_second = metrics.gauge('arby_arb_engine_matches_per_second', 'Matches per second of the latest engine run.')
+scan_arbs_found = metrics.histogram('arby_scan_arbs_found', 'Arbs found per live scan.', ('scan',), buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000))
+dump_write_seconds = metrics.histogram('arby_dump_write_seconds', 'Time to write a scan to the snapshot store.')
+http_request_seconds = metrics.histogram('arby_http_request_seconds', 'Latency of API requests until the response is returned.', ('endpoint', 'method', 'status'))
+response_cache_events = metrics.counter('arby_response_cache_events_total', 'Upstream response cache hits, misses and evictions.', ('result',))
+response_cache_bytes = metrics.gauge('arby_response_cache_bytes', 'Approximate size of the upstream response cache.')
+
+# Sampling profiler: a background thread records the stacks of the profiled threads every
+# `interval` seconds. Threads that already existed when profiling started are ignored, except the
+# caller, so idle workers do not drown out the scan. Stacks are aggregated as folded lines
+# ("outer;inner count"), the input format of flame graph tools such as speedscope.
+class SamplingProfiler:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples = 0
+        self.stacks = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._ignored = set()
+
+    def start(self):
+        caller = threading.get_ident()
+        self._ignored = {thread.ident for thread in threading.enumerate() if thread.ident != caller}
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own or ident in self._ignored:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                folded = ';'.join(reversed(stack))
+                self.stacks[folded] = self.stacks.get(folded, 0) + 1
+            self.samples += 1
+
+    def folded(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]))
+
+# Intern repeated strings (team, bookmaker and sport names) so snapshots share one copy
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+# Compact in-memory representation of an odds snapshot. Matches are normalized once per
+# fetch: names are stripped and interned, timestamps are integer epochs, h2h outcomes are
+# kept in `outcomes` as (name, price) tuples and outcomes of other markets (spreads, totals)
+# as (market, name, price, point) tuples in `lines`, so the hot loops never touch raw JSON
+# dicts. Outcomes are plain tuples rather than objects: they are several times cheaper to
+# build, and the garbage collector stops tracking tuples of strings and numbers, so large
+# snapshots do not slow every later collection down.
+class BookmakerQuote:
+    __slots__ = ('key', 'title', 'link', 'last_update', 'outcomes', 'lines')
+
+    def __init__(self, key: str, title: str, link, last_update: int, outcomes: tuple, lines: tuple = ()):
+        self.key = key
+        self.title = title
+        self.link = link
+        self.last_update = last_update
+        self.outcomes = outcomes
+        self.lines = lines
+
+    # Nameless outcomes are ignored everywhere, so they are dropped up front
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'BookmakerQuote':
+        outcomes = []
+        lines = []
+        intern = sys.intern
+        for market in raw.get('markets', ()):
+            market_key = market.get('key')
+            if market_key == 'h2h':
+                for outcome in market.get('outcomes', ()):
+                    name = outcome.get('name')
+                    if name:
+                        outcomes.append((intern(name.strip()), outcome.get('price')))
+            elif market_key in LINE_MARKETS:
+                market_key = intern(market_key)
+                for outcome in market.get('outcomes', ()):
+                    name = outcome.get('name')
+                    if name:
+                        lines.append((market_key, intern(name.strip()), outcome.get('price'), outcome.get('point')))
+        return cls(_intern(raw.get('key')), _intern(raw.get('title')), raw.get('link'), int(raw.get('last_update') or 0),
+                   tuple(outcomes), tuple(lines))
+
+    @property
+    def display_title(self) -> str:
+        return self.title if self.title is not None else 'Unknown Bookmaker'
+
+    # Link for placing the bet, falling back to a placeholder when the API does not supply one
+    def bet_link(self, sport_key: str, event: str) -> str:
+        if self.link is not None:
+            return self.link
+        return f"https://www.example.com/{sport_key}/{event.replace(' ', '-')}?bookmaker={self.display_title}"
+
+class Match:
+    __slots__ = ('id', 'sport_key', 'sport_title', 'commence_time', 'home_team', 'away_team', 'bookmakers')
+    market = 'h2h'  # Overridden by MarketLine views
+    line = None
+
+    def __init__(self, id: str, sport_key: str, sport_title: str, commence_time: int, home_team: str, away_team: str, bookmakers: tuple):
+        self.id = id
+        self.sport_key = sport_key
+        self.sport_title = sport_title
+        self.commence_time = commence_time
+        self.home_team = home_team
+        self.away_team = away_team
+        self.bookmakers = bookmakers
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'Match':
+        return cls(
+            id=raw.get('id'),
+            sport_key=_intern(raw.get('sport_key', 'Unknown')),
+            sport_title=raw.get('sport_title'),
+            commence_time=int(raw.get('commence_time') or 0),
+            home_team=_intern(raw.get('home_team', 'Unknown')),
+            away_team=_intern(raw.get('away_team', 'Unknown')),
+            bookmakers=tuple([BookmakerQuote.from_dict(b) for b in raw.get('bookmakers', ())]),
+        )
+
+    @property
+    def event(self) -> str:
+        return f"{self.home_team} vs. {self.away_team}"
+
+    @property
+    def date_str(self) -> str:
+        return datetime.fromtimestamp(self.commence_time).strftime('%Y-%m-%d %H:%M:%S') if self.commence_time else 'N/A'
+
+# Normalize raw match dicts into Match records; already-normalized matches pass through
+def to_matches(matches: list) -> list:
+    return [m if isinstance(m, Match) else Match.from_dict(m) for m in matches]
+
+# Lazy to_matches for consumers that keep only part of each match (e.g. the subset index)
+def iter_matches(matches):
+    for m in matches:
+        yield m if isinstance(m, Match) else Match.from_dict(m)
+
+# View of one line of a non-h2h market (e.g. totals 2.5, or the home -1.5 spread) as a match
+# whose bookmakers quote only that line's outcomes, so the engines evaluate it exactly like h2h
+class MarketLine(Match):
+    __slots__ = ('market', 'line')
+
+    def __init__(self, match: Match, market: str, line, bookmakers: tuple):
+        super().__init__(match.id, match.sport_key, match.sport_title, match.commence_time, match.home_team, match.away_team, bookmakers)
+        self.market = market
+        self.line = line
+
+    # Spreads are quoted from each team's side: the away team's point is the negated line
+    def point_for(self, name: str):
+        if self.market.endswith('spreads') and name == self.away_team and self.line is not None:
+            return -self.line + 0.0
+        return self.line
+
+# Line an outcome belongs to. Spread lines are keyed from the home team's side so that the
+# home -1.5 and away +1.5 quotes land on the same line; other markets use the point as is.
+def market_line(match: Match, market: str, name: str, point):
+    if point is None:
+        return None
+    if market.endswith('spreads') and name == match.away_team:
+        return -point + 0.0
+    return point
+
+# Expand matches into the views the engines evaluate: each match itself (h2h) followed by one
+# MarketLine per (market, line), grouped in a single pass over every bookmaker's lines.
+# Bookmaker order is preserved, so ties resolve as they do for h2h. Views are generated one
+# match at a time, so a lazy input is never held in memory as a whole.
+def expand_markets(matches):
+    for match in matches:
+        yield match
+        groups = None
+        for position, bookmaker in enumerate(match.bookmakers):
+            if not bookmaker.lines:
+                continue
+            if groups is None:
+                groups = {}
+            for market, name, price, point in bookmaker.lines:
+                by_bookmaker = groups.setdefault((market, market_line(match, market, name, point)), {})
+                by_bookmaker.setdefault(position, []).append((name, price))
+        if not groups:
+            continue
+        for (market, line), by_bookmaker in groups.items():
+            bookmakers = tuple(
+                BookmakerQuote(bookmaker.key, bookmaker.title, bookmaker.link, bookmaker.last_update, tuple(by_bookmaker[position]))
+                for position, bookmaker in enumerate(match.bookmakers) if position in by_bookmaker
+            )
+            yield MarketLine(match, market, line, bookmakers)
+
+# Label an arb found on a spreads/totals line with its market and points; h2h arbs are left as is
+def label_market(arb: dict, market: str, line, point_for) -> dict:
+    arb['market'] = market
+    arb['point'] = line
+    for leg in arb['odds']:
+        leg['point'] = point_for(leg['team'])
+    return arb
+
+# Compute the [start, end] epoch bounds for a timeframe ('today', 'week', 'month'), or None for no filtering
+def timeframe_bounds(timeframe: str, current_time: datetime = None):
+    current_time = current_time or datetime.now()
+    if timeframe == 'today':
+        start_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_time = current_time.replace(hour=23, minute=59, second=59, microsecond=999999)
+    elif timeframe == 'week':
+        start_time = current_time - timedelta(days=current_time.weekday())
+        end_time = start_time + timedelta(days=6)
+    elif timeframe == 'month':
+        start_time = current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        end_time = (start_time + timedelta(days=31)).replace(day=1) - timedelta(seconds=1)
+    else:
+        return None
+    return start_time.timestamp(), end_time.timestamp()
+
+# Keep only matches whose commence time falls inside the given epoch bounds
+def filter_matches_by_timeframe(matches: list, bounds) -> list:
+    if bounds is None:
+        return matches
+    start_ts, end_ts = bounds
+    return [match for match in matches if start_ts <= match.commence_time <= end_ts]
+
 # Handle faulty API responses based on status code
 def handle_faulty_response(response: requests.Response):
     if response.status_code == 401:
@@ -74,12 +734,175 @@ def handle_faulty_response(response: requests.Response):
             error_message = "No message provided"
         raise APIException(f"Unknown issue: {error_message}", response)
 
-# Fetch available sports from The Odds API
-def get_sports(key: str) -> set:
+# Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # Block until `tokens` are available and take them
+    def acquire(self, tokens: float = 1):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Client-side governor for Odds API calls. It optionally paces requests with a token bucket, retries
+# 429s with jittered exponential backoff, tracks the quota reported in the response headers
+# and, when quota runs low, decides which sports are still worth refreshing.
+class RateGovernor:
+    def __init__(self, rate: float, burst: float, max_retries: int, backoff_base: float, backoff_cap: float, quota_reserve: int):
+        self.bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.quota_reserve = quota_reserve
+        self.requests_remaining = None
+        self.requests_used = None
+        self.last_cost = None
+        self.quota_updated_at = None
+        self.retries = 0
+        self.skipped_sports = 0
+        self._soonest_event = {}  # sport -> soonest commence time in its last odds, or None
+        self._lock = threading.Lock()
+
+    # Perform a GET through the shared session, honouring the rate limit and retrying 429s.
+    # Quota-free endpoints (sports list, event calendars) pass paced=False so they never
+    # take tokens from odds calls.
+    def get(self, url: str, params: dict, paced: bool = True) -> requests.Response:
+        attempt = 0
+        while True:
+            if paced and self.bucket is not None:
+                self.bucket.acquire()
+            endpoint, sport = upstream_labels(url)
+            start = time.perf_counter()
+            try:
+                response = http_session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            except requests.RequestException:
+                upstream_responses.inc(endpoint=endpoint, status='error')
+                raise
+            upstream_request_seconds.observe(time.perf_counter() - start, endpoint=endpoint, sport=sport)
+            upstream_response_bytes.inc(len(response.content), endpoint=endpoint, sport=sport)
+            upstream_responses.inc(endpoint=endpoint, status=response.status_code)
+            self.update_quota(response)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            logging.warning(f"Rate limited by the odds API; retry {attempt}/{self.max_retries} in {delay:.2f}s")
+            time.sleep(delay)
+
+    def update_quota(self, response: requests.Response):
+        remaining = response.headers.get('x-requests-remaining')
+        used = response.headers.get('x-requests-used')
+        last = response.headers.get('x-requests-last')
+        if remaining is None and used is None:
+            return
+        with self._lock:
+            try:
+                if remaining is not None:
+                    self.requests_remaining = int(float(remaining))
+                if used is not None:
+                    self.requests_used = int(float(used))
+                if last is not None:
+                    self.last_cost = int(float(last))
+            except ValueError:
+                logging.warning(f"Unparseable quota headers: remaining={remaining}, used={used}, last={last}")
+            self.quota_updated_at = time.time()
+
+    # Remember how soon each sport's next event is, to rank sports when quota is scarce
+    def record_sport(self, sport: str, matches: list):
+        commence_times = [match.commence_time for match in matches if match.commence_time]
+        with self._lock:
+            self._soonest_event[sport] = min(commence_times) if commence_times else None
+
+    def _priority(self, sport: str) -> tuple:
+        if sport not in self._soonest_event:
+            return (1, 0)  # Unknown sports rank after sports with known upcoming events
+        soonest = self._soonest_event[sport]
+        if soonest is None:
+            return (2, 0)  # Sports with no events last time come last
+        return (0, soonest)
+
+    # Pick the sports to refresh within the remaining quota (minus the reserve), soonest events first
+    def select_sports(self, sports, cost_per_sport: int = 1) -> list:
+        sports = list(sports)
+        with self._lock:
+            remaining = self.requests_remaining
+            if remaining is None:
+                return sports
+            budget = remaining - self.quota_reserve
+            if budget >= cost_per_sport * len(sports):
+                return sports
+            affordable = max(0, int(budget // max(1, cost_per_sport)))
+            selected = sorted(sports, key=self._priority)[:affordable]
+            self.skipped_sports += len(sports) - len(selected)
+        logging.warning(f"Quota low ({remaining} requests remaining); refreshing {len(selected)} of {len(sports)} sports.")
+        return selected
+
+    def quota(self) -> dict:
+        with self._lock:
+            return {
+                'requests_remaining': self.requests_remaining,
+                'requests_used': self.requests_used,
+                'last_cost': self.last_cost,
+                'updated_at': self.quota_updated_at,
+                'reserve': self.quota_reserve,
+                'retries': self.retries,
+                'skipped_sports': self.skipped_sports,
+            }
+
+# Metric labels for an upstream URL: ('sports', '') for the sports list, otherwise the
+# per-sport endpoint ('odds' or 'events') and the sport key
+def upstream_labels(url: str) -> tuple:
+    parts = [part for part in url[len(BASE_URL):].split('/') if part] if url.startswith(BASE_URL) else []
+    if parts == ['sports']:
+        return 'sports', ''
+    if len(parts) == 3 and parts[0] == 'sports':
+        return parts[2], parts[1]
+    return 'other', ''
+
+# Shared governor for every upstream call
+rate_governor = RateGovernor(
+    rate=ODDS_API_RATE,
+    burst=ODDS_API_BURST,
+    max_retries=ODDS_API_MAX_RETRIES,
+    backoff_base=ODDS_API_BACKOFF_BASE,
+    backoff_cap=ODDS_API_BACKOFF_CAP,
+    quota_reserve=ODDS_API_QUOTA_RESERVE,
+)
+
+# Quota cost of one odds call: the Odds API charges one unit per region per market
+def odds_call_cost(regions: list, markets: int = 1) -> int:
+    return max(1, len(set(regions))) * markets
+
+# Fetch sports metadata (key, active, has_outrights, ...) from The Odds API
+def get_sports_metadata(key: str) -> list:
+    cache_key = ('sports',)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logging.info(f"Using cached sports list ({len(cached)} sports).")
+        return cached
+
     url = f"{BASE_URL}/sports/"
     params = {"apiKey": key}
 
-    response = requests.get(url, params=params)
+    response = rate_governor.get(url, params, paced=False)
     if response.status_code != 200:
         handle_faulty_response(response)
 
@@ -89,24 +912,95 @@ def get_sports(key: str) -> set:
         logging.error("Invalid JSON response when fetching sports.")
         raise APIException("Invalid JSON response when fetching sports.", response)
 
-    # Extract sport keys from the response
-    sport_keys = {item["key"] for item in sports}
-    logging.info(f"Fetched {len(sport_keys)} sports.")
+    logging.info(f"Fetched {len(sports)} sports.")
+    response_cache.set(cache_key, sports, SPORTS_CACHE_TTL, size=len(response.content))
+    return sports
+
+# Fetch the keys of sports that can have head-to-head odds. Inactive sports and
+# outright-only sports (futures such as tournament winners) never return h2h events.
+def get_sports(key: str) -> set:
+    sports = get_sports_metadata(key)
+    sport_keys = {
+        item["key"] for item in sports
+        if item.get("active", True) and not item.get("has_outrights", False)
+    }
+    logging.info(f"{len(sport_keys)} of {len(sports)} sports can have h2h odds.")
     return sport_keys
 
+# Fetch the commence times of a sport's upcoming events. The events endpoint does not
+# count against the odds quota, so this calendar is a cheap way to skip empty sports.
+def get_event_calendar(key: str, sport: str) -> list:
+    cache_key = ('events', sport)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    url = f"{BASE_URL}/sports/{sport}/events"
+    params = {"apiKey": key, "dateFormat": "unix"}
+
+    response = rate_governor.get(url, params, paced=False)
+    if response.status_code != 200:
+        handle_faulty_response(response)
+
+    try:
+        events = response.json()
+    except json.JSONDecodeError:
+        logging.error(f"Invalid JSON response for events of sport: {sport}.")
+        raise APIException(f"Invalid JSON response for events of sport: {sport}.", response)
+
+    commence_times = sorted(int(event.get("commence_time") or 0) for event in events)
+    response_cache.set(cache_key, commence_times, EVENT_CALENDAR_TTL, size=len(response.content))
+    return commence_times
+
+# Choose the sports worth an odds call for the given epoch bounds: only sports whose event
+# calendar has an event in the window. Sports whose calendar cannot be fetched are kept.
+def plan_sports(key: str, sports, bounds) -> list:
+    sports = list(sports)
+    if bounds is None:
+        return sports
+
+    start_ts, end_ts = bounds
+    planned = []
+    with ThreadPoolExecutor(max_workers=max(1, MAX_FETCH_WORKERS), thread_name_prefix='calendar-fetch') as executor:
+        futures = {executor.submit(get_event_calendar, key, sport): sport for sport in sports}
+        for future in as_completed(futures):
+            sport = futures[future]
+            try:
+                commence_times = future.result()
+            except AuthenticationException:
+                raise
+            except (APIException, requests.RequestException) as e:
+                logging.warning(f"Could not fetch event calendar for {sport}, keeping it: {e}")
+                planned.append(sport)
+                continue
+            if any(start_ts <= commence_time <= end_ts for commence_time in commence_times):
+                planned.append(sport)
+
+    logging.info(f"Planner selected {len(planned)} of {len(sports)} sports with events in the requested timeframe.")
+    return planned
+
 # Fetch odds data for a given sport and regions
 def get_data(key: str, sport: str, regions: list):
+    markets = ",".join(ODDS_MARKETS)  # All markets in one call; each costs one unit per region
+
+    # Region order does not change the response, so normalize it for the cache key
+    cache_key = ('odds', sport, tuple(sorted(set(regions))), markets)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logging.info(f"Using cached data for sport: {sport} with regions: {regions}")
+        return cached
+
     url = f"{BASE_URL}/sports/{sport}/odds/"
     params = {
         "apiKey": key,
         "regions": ",".join(regions),
-        "markets": "h2h",  # Only get head-to-head markets
+        "markets": markets,
         "oddsFormat": "decimal",
         "dateFormat": "unix"
     }
 
     logging.info(f"Fetching data for sport: {sport} with regions: {regions}")
-    response = requests.get(url, params=params)
+    response = rate_governor.get(url, params)
     if response.status_code != 200:
         handle_faulty_response(response)
 
@@ -116,199 +1010,942 @@ def get_data(key: str, sport: str, regions: list):
         logging.error(f"Invalid JSON response for sport: {sport}.")
         raise APIException(f"Invalid JSON response for sport: {sport}.", response)
 
+    # Normalize once per fetch so every later pass works on the compact model
+    data = to_matches(data)
+    rate_governor.record_sport(sport, data)
+
+    # Cached matches are shared between callers and must be treated as read-only
+    response_cache.set(cache_key, data, ODDS_CACHE_TTL, size=len(response.content))
     return data
 
-# Process match data to find arbitrage opportunities
-def process_data(matches: list, include_started_matches: bool = True, selected_bookmakers: list = None) -> list:
-    arbs = []
-    current_time = time.time()
+# Fetch odds for many sports concurrently, yielding (sport, matches) as each one completes.
+# Per-sport API errors (including 429s that outlast the governor's retries) are logged and
+# skipped; an authentication failure cancels the remaining requests and is re-raised since
+# every other request would fail the same way.
+def fetch_odds_concurrently(key: str, sports, regions: list, max_workers: int = None):
+    max_workers = max(1, max_workers or MAX_FETCH_WORKERS)
+    # When quota runs low only the most valuable sports are fetched
+    sports = rate_governor.select_sports(sports, odds_call_cost(regions, len(ODDS_MARKETS)))
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='odds-fetch')
+    try:
+        futures = {executor.submit(get_data, key, sport, regions): sport for sport in sports}
+        for future in as_completed(futures):
+            sport = futures[future]
+            try:
+                matches = future.result()
+            except AuthenticationException as e:
+                logging.error(f"Authentication failed while fetching odds for sport {sport}: {e}. Cancelling scan.")
+                raise
+            except (APIException, requests.RequestException) as e:
+                logging.error(f"Error fetching odds for sport {sport}: {e}")
+                continue
+            yield sport, matches
+    finally:
+        # Drop queued requests and wait for in-flight ones so no threads outlive the scan
+        executor.shutdown(wait=True, cancel_futures=True)
+
+# Build the arb dict returned to the frontend from the best (price, bookmaker) per outcome
+def build_arb(match: Match, required_outcomes: list, best_odds: dict, implied_probability: float, is_live: bool) -> dict:
+    sport_key = match.sport_key
+    event = match.event
+    profit = round((1.0 - implied_probability) * 100, 2)
+    # Structure odds as a list for frontend compatibility
+    odds_list = [
+        {
+            'team': outcome,
+            'price': best_odds[outcome][0],
+            'bookmaker': best_odds[outcome][1].display_title,
+            'stake': round((1 / best_odds[outcome][0]) / implied_probability * 100, 2),  # Calculate stake percentage
+            'link': best_odds[outcome][1].bet_link(sport_key, event)  # Include link for placing bet
+        }
+        for outcome in required_outcomes
+    ]
+    arb = {
+        'sport': sport_key,
+        'event': event,
+        'date': match.date_str,
+        'profit': profit,
+        'is_live': is_live,  # Add live status
+        'odds': odds_list
+    }
+    if match.market != 'h2h':
+        label_market(arb, match.market, match.line, match.point_for)
+    return arb
+
+# Evaluate a single match and return its arbitrage opportunity, or None if there is none.
+# `selected` is the set of bookmaker titles to consider (None for all).
+def evaluate_match(match: Match, include_started_matches: bool, selected: set, current_time: float):
+    start_time = match.commence_time
+    is_live = start_time <= current_time and start_time != 0
+    # Decide once per event, so a sampled event keeps its whole trace
+    debug = engine_log.isEnabledFor(logging.DEBUG) and random.random() < LOG_DEBUG_SAMPLE_RATE
+
+    # Skip matches that have already started if not including them
+    if not include_started_matches and start_time < current_time:
+        if debug:
+            engine_log.debug("Skipping already started match: %s vs %s", match.home_team, match.away_team)
+        return None
+
+    bookmakers = match.bookmakers
+
+    # Skip if there are not enough bookmakers to create an arbitrage
+    if len(bookmakers) < 2:
+        if debug:
+            engine_log.debug("Skipping %s vs %s due to insufficient bookmakers.", match.home_team, match.away_team)
+        return None
+
+    # Extract match information
+    event = match.event
+
+    # Determine available outcomes dynamically
+    outcomes_set = set()
+    for bookmaker in bookmakers:
+        for name, _ in bookmaker.outcomes:
+            outcomes_set.add(name)
+
+    if len(outcomes_set) < 2:
+        if debug:
+            engine_log.debug("Skipping %s due to insufficient outcomes.", event)
+        return None
+
+    required_outcomes = list(outcomes_set)
+    if debug:
+        engine_log.debug("Processing event: %s", event)
+        engine_log.debug("Required outcomes: %s", required_outcomes)
+
+    # Find the best odds for each outcome as (price, bookmaker) pairs
+    best_odds = {}
+    for bookmaker in bookmakers:
+        # Filter bookmakers based on user selection
+        if selected and bookmaker.title not in selected:
+            continue
 
-    for match in matches:
-        start_time = match.get("commence_time", 0)
-        is_live = start_time <= current_time and start_time != 0
+        for name, price in bookmaker.outcomes:
+            if not price:
+                continue
 
-        # Skip matches that have already started if not including them
-        if not include_started_matches and start_time < current_time:
-            logging.debug(f"Skipping already started match: {match.get('home_team')} vs {match.get('away_team')}")
-            continue
+            # Update best odds if higher
+            best = best_odds.get(name)
+            if best is None or best[0] < price:
+                best_odds[name] = (price, bookmaker)
 
-        bookmakers = match.get("bookmakers", [])
+    if debug:
+        engine_log.debug("Best odds for event %s: %s", event, {name: (price, bookmaker.display_title) for name, (price, bookmaker) in best_odds.items()})
 
-        # Skip if there are not enough bookmakers to create an arbitrage
-        if len(bookmakers) < 2:
-            logging.debug(f"Skipping {match.get('home_team')} vs {match.get('away_team')} due to insufficient bookmakers.")
-            continue
+    # Ensure all required outcomes are present in best_odds
+    if not all(outcome in best_odds for outcome in required_outcomes):
+        if debug:
+            engine_log.debug("Skipping %s due to missing required outcomes in best_odds.", event)
+        return None
 
-        # Extract match information
-        event = f"{match.get('home_team', 'Unknown')} vs. {match.get('away_team', 'Unknown')}"
-        sport_key = match.get('sport_key', 'Unknown')
-        match_date = datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S') if start_time else 'N/A'
+    # Calculate implied probability of each outcome
+    try:
+        implied_probability = sum(1 / best_odds[outcome][0] for outcome in required_outcomes)
+        if debug:
+            engine_log.debug("Implied probability for %s: %.4f", event, implied_probability)
+    except ZeroDivisionError:
+        engine_log.warning("Invalid price encountered for %s. Skipping.", event)
+        return None
+
+    # Check if there's an arbitrage opportunity (implied probability < 1)
+    threshold = 1.0
+    epsilon = 1e-5  # Small value to account for floating-point precision
+    if implied_probability < (threshold - epsilon):
+        arb = build_arb(match, required_outcomes, best_odds, implied_probability, is_live)
+        arb_log.debug("Arb found for %s: Profit %s%%", event, arb['profit'], extra={'arb': arb})
+        return arb
+
+    if debug:
+        engine_log.debug("No arbitrage opportunity for %s. Implied probability: %.4f", event, implied_probability)
+    return None
 
-        # Determine available outcomes dynamically
-        outcomes_set = set()
-        for bookmaker in bookmakers:
-            for market in bookmaker.get('markets', []):
-                if market.get('key') != 'h2h':
-                    continue
-                for outcome in market.get('outcomes', []):
-                    name = outcome.get('name')
-                    if name:
-                        outcomes_set.add(name.strip())
+# Process match data to find arbitrage opportunities
+def process_data(matches: list, include_started_matches: bool = True, selected_bookmakers: list = None, current_time: float = None) -> list:
+    arbs = []
+    if current_time is None:
+        current_time = time.time()
+    selected = set(selected_bookmakers) if selected_bookmakers else None
 
-        if len(outcomes_set) < 2:
-            logging.debug(f"Skipping {event} due to insufficient outcomes.")
-            continue
+    for match in expand_markets(to_matches(matches)):
+        arb = evaluate_match(match, include_started_matches, selected, current_time)
+        if arb is not None:
+            arbs.append(arb)
+
+    # Sort arbitrage opportunities by profit in descending order
+    arbs.sort(key=lambda x: x['profit'], reverse=True)
+    logging.info("Total arbs found: %d", len(arbs))
 
-        required_outcomes = list(outcomes_set)
-        logging.debug(f"Processing event: {event}")
-        logging.debug(f"Required outcomes: {required_outcomes}")
+    return arbs
+
+# Run the arbitrage engine and record its timing and throughput metrics.
+# current_time defaults to now; replays pass the snapshot's capture time instead.
+def run_arb_engine(matches: list, include_started_matches: bool = True, selected_bookmakers: list = None, current_time: float = None) -> list:
+    start = time.perf_counter()
+    arbs = process_data(matches, include_started_matches=include_started_matches, selected_bookmakers=selected_bookmakers, current_time=current_time)
+    elapsed = time.perf_counter() - start
+    arb_engine_seconds.observe(elapsed)
+    arb_engine_matches.inc(len(matches))
+    if elapsed > 0:
+        arb_engine_matches_per_second.set(round(len(matches) / elapsed, 1))
+    return arbs
 
-        # Find the best odds for each outcome
-        best_odds = {}
-        for bookmaker in bookmakers:
-            # Filter bookmakers based on user selection
-            if selected_bookmakers and bookmaker.get('title') not in selected_bookmakers:
+# Per-event index for answering "best arbs for this bookmaker subset" without touching raw
+# quotes. Every outcome keeps its quotes sorted by price (ties by bookmaker order, as in
+# process_data) together with the bit of the quoting bookmaker's title, so a subset query
+# is a scan for the first quote whose bit is set in the mask. Only events that are arbs
+# with all bookmakers are indexed: a subset can never beat the best price over all of them.
+# `matches` may be a generator; it is consumed one match at a time and only candidates are kept.
+class BookmakerSubsetIndex:
+    def __init__(self, matches):
+        self.bookmaker_bits = {}
+        self.candidates = []  # (match, required_outcomes, ladders) per candidate event
+        self.event_count = 0
+
+        for match in expand_markets(iter_matches(matches)):
+            self.event_count += match.market == 'h2h'
+            bookmakers = match.bookmakers
+            if len(bookmakers) < 2:
                 continue
 
-            for market in bookmaker.get('markets', []):
-                if market.get('key') != 'h2h':
-                    continue  # Only consider head-to-head markets
-                for outcome in market.get('outcomes', []):
-                    team_name = outcome.get('name')
-                    price = outcome.get('price')
-                    if not team_name or not price:
-                        continue
+            outcomes_set = set()
+            for bookmaker in bookmakers:
+                for name, _ in bookmaker.outcomes:
+                    outcomes_set.add(name)
+            if len(outcomes_set) < 2:
+                continue
+            required_outcomes = list(outcomes_set)
 
-                    # Standardize team name and update best odds if higher
-                    standardized_name = team_name.strip()
-                    if standardized_name not in best_odds or best_odds[standardized_name]['price'] < price:
-                        best_odds[standardized_name] = {
-                            'price': price,
-                            'bookmaker': bookmaker.get('title', 'Unknown Bookmaker'),
-                            'link': bookmaker.get('link', f"https://www.example.com/{sport_key}/{event.replace(' ', '-')}?bookmaker={bookmaker.get('title', 'Unknown Bookmaker')}")
-                        }
+            ladders = {name: [] for name in required_outcomes}
+            for position, bookmaker in enumerate(bookmakers):
+                bit = self._bit(bookmaker.title)
+                for name, price in bookmaker.outcomes:
+                    if price:
+                        ladders[name].append((price, position, bit, bookmaker))
 
-        logging.debug(f"Best odds for event {event}: {best_odds}")
+            if not all(ladders.values()):
+                continue
+            for ladder in ladders.values():
+                ladder.sort(key=lambda quote: (-quote[0], quote[1]))
 
-        # Ensure all required outcomes are present in best_odds
-        if not all(outcome in best_odds for outcome in required_outcomes):
-            logging.debug(f"Skipping {event} due to missing required outcomes in best_odds.")
-            continue
+            # Upper bound over every bookmaker; events that are not arbs here never will be
+            implied_probability = sum(1 / ladders[name][0][0] for name in required_outcomes)
+            if implied_probability >= 1.0 - 1e-5:
+                continue
 
-        # Calculate implied probability of each outcome
-        try:
-            implied_probability = sum(1 / best_odds[outcome]['price'] for outcome in required_outcomes)
-            logging.debug(f"Implied probability for {event}: {implied_probability:.4f}")
-        except ZeroDivisionError:
-            logging.warning(f"Invalid price encountered for {event}. Skipping.")
-            continue
+            self.candidates.append((match, required_outcomes, [
+                [(price, bit, bookmaker) for price, _, bit, bookmaker in ladders[name]]
+                for name in required_outcomes
+            ]))
+
+    def _bit(self, title) -> int:
+        bit = self.bookmaker_bits.get(title)
+        if bit is None:
+            bit = self.bookmaker_bits[title] = 1 << len(self.bookmaker_bits)
+        return bit
+
+    # Bitmask for a list of bookmaker titles; no selection means every bookmaker
+    def mask_for(self, selected_bookmakers: list) -> int:
+        if not selected_bookmakers:
+            return -1  # All bits set
+        mask = 0
+        for title in selected_bookmakers:
+            mask |= self.bookmaker_bits.get(title, 0)
+        return mask
+
+    # Arbs available to the bookmaker subset, sorted by profit like process_data
+    def query(self, mask: int, include_started_matches: bool = True, current_time: float = None, bounds=None) -> list:
+        if current_time is None:
+            current_time = time.time()
+        arbs = []
+        for match, required_outcomes, ladders in self.candidates:
+            start_time = match.commence_time
+            if not include_started_matches and start_time < current_time:
+                continue
+            if bounds is not None and not (bounds[0] <= start_time <= bounds[1]):
+                continue
 
-        # Check if there's an arbitrage opportunity (implied probability < 1)
-        threshold = 1.0
-        epsilon = 1e-5  # Small value to account for floating-point precision
-        if implied_probability < (threshold - epsilon):
-            profit = round((threshold - implied_probability) * 100, 2)
-            # Structure odds as a list for frontend compatibility
-            odds_list = [
-                {
-                    'team': outcome,
-                    'price': best_odds[outcome]['price'],
-                    'bookmaker': best_odds[outcome]['bookmaker'],
-                    'stake': round((1 / best_odds[outcome]['price']) / implied_probability * 100, 2),  # Calculate stake percentage
-                    'link': best_odds[outcome]['link']  # Include link for placing bet
-                }
-                for outcome in required_outcomes
-            ]
-            arb = {
-                'sport': sport_key,
-                'event': event,
-                'date': match_date,
-                'profit': profit,
-                'is_live': is_live,  # Add live status
-                'odds': odds_list
-            }
-            arbs.append(arb)
-            logging.info(f"Arb found for {event}: Profit {profit}%")
-        else:
-            logging.debug(f"No arbitrage opportunity for {event}. Implied probability: {implied_probability:.4f}")
+            best_odds = {}
+            for name, ladder in zip(required_outcomes, ladders):
+                for price, bit, bookmaker in ladder:
+                    if bit & mask:
+                        best_odds[name] = (price, bookmaker)
+                        break
+                else:
+                    break  # No selected bookmaker quotes this outcome
+            if len(best_odds) != len(required_outcomes):
+                continue
 
-    # Sort arbitrage opportunities by profit in descending order
-    arbs.sort(key=lambda x: x['profit'], reverse=True)
-    logging.info(f"Total arbs found: {len(arbs)}")
+            implied_probability = sum(1 / best_odds[name][0] for name in required_outcomes)
+            if implied_probability < 1.0 - 1e-5:
+                is_live = start_time <= current_time and start_time != 0
+                arbs.append(build_arb(match, required_outcomes, best_odds, implied_probability, is_live))
+
+        arbs.sort(key=lambda x: x['profit'], reverse=True)
+        return arbs
+
+# Stateful arb detector for successive polls. It remembers each event's bookmaker update
+# stamps and current arbs, and re-normalizes, expands and evaluates only events whose stamps
+# changed (or whose open arbs just started); the difference is reported as 'opened',
+# 'changed' and 'closed' events. Unchanged events cost one stamp comparison per poll.
+class IncrementalArbDetector:
+    def __init__(self, include_started_matches: bool = False, selected_bookmakers: list = None):
+        self.include_started_matches = include_started_matches
+        self.selected = set(selected_bookmakers) if selected_bookmakers else None
+        self._events = {}  # event key -> [stamp, match, {view key: [view, arb]}]
+        self.evaluated = 0
+        self.skipped = 0
+
+    # Key of an event, or of one of its market line views
+    @staticmethod
+    def event_key(match: Match) -> tuple:
+        if match.market != 'h2h':
+            return (match.sport_key, match.id or match.event, match.commence_time, match.market, match.line)
+        return (match.sport_key, match.id or match.event, match.commence_time)
+
+    # Same key read from a raw match dict, so unchanged events are never normalized
+    @staticmethod
+    def raw_event_key(raw: dict) -> tuple:
+        home_team, away_team = raw.get('home_team', 'Unknown'), raw.get('away_team', 'Unknown')
+        return (raw.get('sport_key', 'Unknown'), raw.get('id') or f"{home_team} vs. {away_team}", int(raw.get('commence_time') or 0))
+
+    # Bookmakers and their last_update times; the Odds API bumps last_update whenever a
+    # bookmaker's quotes change, so equal stamps mean unchanged quotes
+    @staticmethod
+    def stamp(match) -> tuple:
+        if isinstance(match, Match):
+            return tuple((bookmaker.key, bookmaker.last_update) for bookmaker in match.bookmakers)
+        return tuple((bookmaker.get('key'), int(bookmaker.get('last_update') or 0)) for bookmaker in match.get('bookmakers', ()))
+
+    @property
+    def open_arbs(self) -> list:
+        return [arb for state in self._events.values() for _, arb in state[2].values() if arb is not None]
+
+    # Apply a new snapshot (Match records or raw dicts) and return the arb diffs. When `sports`
+    # is given the snapshot only replaces those sports (per-sport polling); otherwise it
+    # replaces the whole market.
+    def update(self, matches: list, sports=None, current_time: float = None) -> list:
+        if current_time is None:
+            current_time = time.time()
+        diffs = []
+        self.evaluated = 0
+        self.skipped = 0
+        seen = set()
+
+        for item in matches:
+            normalized = isinstance(item, Match)
+            key = self.event_key(item) if normalized else self.raw_event_key(item)
+            seen.add(key)
+            state = self._events.get(key)
+
+            if state is not None and (state[1] is item or state[0] == self.stamp(item)):
+                # Unchanged quotes: only the clock can change the outcome, by the match starting
+                self.skipped += 1
+                if self.include_started_matches or key[2] >= current_time:
+                    continue
+                for view_key, view_state in state[2].items():
+                    if view_state[1] is not None:
+                        self.evaluated += 1
+                        arb = evaluate_match(view_state[0], self.include_started_matches, self.selected, current_time)
+                        diffs.append(self._diff(view_key, view_state[1], arb))
+                        view_state[1] = arb
+                continue
 
-    return arbs
+            match = item if normalized else Match.from_dict(item)
+            previous = state[2] if state is not None else {}
+            views = {}
+            for view in expand_markets((match,)):
+                view_key = self.event_key(view)
+                self.evaluated += 1
+                arb = evaluate_match(view, self.include_started_matches, self.selected, current_time)
+                views[view_key] = [view, arb]
+                previous_arb = previous[view_key][1] if view_key in previous else None
+                diff = self._diff(view_key, previous_arb, arb)
+                if diff is not None:
+                    diffs.append(diff)
+            # Lines a bookmaker stopped quoting close their arbs
+            for view_key, (_, previous_arb) in previous.items():
+                if view_key not in views and previous_arb is not None:
+                    diffs.append(self._diff(view_key, previous_arb, None))
+            self._events[key] = [self.stamp(match), match, views]
+
+        # Events that disappeared from the replaced sports (or market) close their arbs
+        replaced = set(sports) if sports is not None else None
+        for key in [key for key in self._events if key not in seen and (replaced is None or key[0] in replaced)]:
+            for view_key, (_, previous_arb) in self._events.pop(key)[2].items():
+                if previous_arb is not None:
+                    diffs.append(self._diff(view_key, previous_arb, None))
+
+        return [diff for diff in diffs if diff is not None]
+
+    @staticmethod
+    def _diff(key: tuple, previous_arb: dict, arb: dict):
+        if previous_arb is None and arb is None:
+            return None
+        if previous_arb is None:
+            return {'type': 'opened', 'key': list(key), 'profit': arb['profit'], 'arb': arb}
+        if arb is None:
+            return {'type': 'closed', 'key': list(key), 'previous_profit': previous_arb['profit'], 'arb': previous_arb}
+        legs = [(leg['team'], leg['bookmaker'], leg['price']) for leg in arb['odds']]
+        previous_legs = [(leg['team'], leg['bookmaker'], leg['price']) for leg in previous_arb['odds']]
+        if arb['profit'] == previous_arb['profit'] and legs == previous_legs:
+            return None
+        return {'type': 'changed', 'key': list(key), 'profit': arb['profit'], 'previous_profit': previous_arb['profit'], 'arb': arb}
+
+# Map human-readable regions to API expected region codes, skipping invalid ones
+def map_regions(regions: list) -> list:
+    mapped_regions = []
+    for region in regions:
+        mapped = REGION_MAPPING.get(region.lower())
+        if mapped:
+            mapped_regions.append(mapped)
+        else:
+            logging.warning(f"Region '{region}' is invalid and will be skipped.")
+    return mapped_regions
 
 # Retrieve arbitrage opportunities across all sports
 def get_arbitrage_opportunities(key: str, regions: list, selected_bookmakers: list, cutoff: float, timeframe: str):
     try:
         # Map human-readable regions to API expected region codes
-        mapped_regions = []
-        for region in regions:
-            mapped = REGION_MAPPING.get(region.lower())
-            if mapped:
-                mapped_regions.append(mapped)
-            else:
-                logging.warning(f"Region '{region}' is invalid and will be skipped.")
+        mapped_regions = map_regions(regions)
 
         if not mapped_regions:
             logging.error("No valid regions provided after mapping.")
             return [], []
 
-        # Fetch available sports
-        sports = get_sports(key)
+        # Determine the date range for filtering
+        bounds = timeframe_bounds(timeframe)
+
+        # Fetch available sports and keep only those with events in the timeframe
+        sports = plan_sports(key, get_sports(key), bounds)
     except APIException as e:
         logging.error(f"Error fetching sports: {e}")
         return [], []
 
     all_arbs = []
-    current_time = datetime.now()
-
-    # Determine the date range for filtering
-    if timeframe == 'today':
-        start_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_time = current_time.replace(hour=23, minute=59, second=59, microsecond=999999)
-    elif timeframe == 'week':
-        start_time = current_time - timedelta(days=current_time.weekday())
-        end_time = start_time + timedelta(days=6)
-    elif timeframe == 'month':
-        start_time = current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        end_time = (start_time + timedelta(days=31)).replace(day=1) - timedelta(seconds=1)
-    else:
-        start_time = None
-        end_time = None
 
     # Initialize a list to hold all fetched matches
     all_fetched_matches = []
 
-    for sport in sports:
-        logging.info(f"Fetching odds for sport: {sport}")
-        try:
-            # Fetch match data for each sport
-            matches = get_data(key, sport, mapped_regions)
-        except APIException as e:
-            logging.error(f"Error fetching odds for sport {sport}: {e}")
-            continue
-
-        # Filter matches based on the selected timeframe
-        if start_time and end_time:
-            matches = [match for match in matches if start_time.timestamp() <= match.get("commence_time", 0) <= end_time.timestamp()]
+    try:
+        # Fetch match data for all sports concurrently over the shared session
+        for sport, matches in fetch_odds_concurrently(key, sports, mapped_regions):
+            # Filter matches based on the selected timeframe
+            matches = filter_matches_by_timeframe(matches, bounds)
 
-        logging.info(f"Processing {len(matches)} matches for sport: {sport}")
+            logging.info(f"Processing {len(matches)} matches for sport: {sport}")
 
-        # Append fetched matches to the master list
-        all_fetched_matches.extend(matches)
+            # Append fetched matches to the master list
+            all_fetched_matches.extend(matches)
+    except AuthenticationException as e:
+        logging.error(f"Aborting scan: {e}")
+        return [], []
 
     # Process all fetched matches to find arbitrage opportunities
-    arbs = process_data(all_fetched_matches, include_started_matches=False, selected_bookmakers=selected_bookmakers)
+    arbs = run_arb_engine(all_fetched_matches, include_started_matches=False, selected_bookmakers=selected_bookmakers)
     # Filter arbitrage opportunities based on profit cutoff
     filtered_arbs = [arb for arb in arbs if arb['profit'] >= cutoff]
     all_arbs.extend(filtered_arbs)
 
-    # Sort arbitrage opportunities by the match date in ascending order
-    all_arbs.sort(key=lambda x: datetime.strptime(x['date'], '%Y-%m-%d %H:%M:%S'))
+    # Sort arbitrage opportunities by the match date in ascending order; the
+    # zero-padded '%Y-%m-%d %H:%M:%S' strings sort chronologically without parsing
+    all_arbs.sort(key=lambda x: x['date'])
+    scan_arbs_found.observe(len(all_arbs), scan='live')
 
     return all_arbs, all_fetched_matches
 
+# Immutable view of the latest polled odds, swapped atomically by the poller
+class OddsSnapshot:
+    __slots__ = ('version', 'regions', 'matches_by_sport', 'fetched_at', 'updated_at', 'next_refresh', 'arb_changes',
+                 'writer_pid', '_bookmaker_index')
+
+    def __init__(self, version: int, regions: tuple, matches_by_sport: dict, fetched_at: dict, updated_at: float,
+                 next_refresh: dict = None, arb_changes: list = None, writer_pid: int = None):
+        self.version = version
+        self.regions = regions
+        self.matches_by_sport = matches_by_sport
+        self.fetched_at = fetched_at
+        self.updated_at = updated_at
+        # Poller schedule and recent arb diffs travel with the snapshot, so every worker serving
+        # it reports the same /api/poller_status and /api/arb_changes as the writer
+        self.next_refresh = next_refresh or {}
+        self.arb_changes = arb_changes or []
+        self.writer_pid = writer_pid or os.getpid()
+        self._bookmaker_index = None
+
+    # Built on first use and reused by every bookmaker-filtered query against this snapshot
+    @property
+    def bookmaker_index(self) -> 'BookmakerSubsetIndex':
+        if self._bookmaker_index is None:
+            self._bookmaker_index = BookmakerSubsetIndex(self.all_matches())
+        return self._bookmaker_index
+
+    def all_matches(self) -> list:
+        return [match for matches in self.matches_by_sport.values() for match in matches]
+
+    # Age in seconds of the oldest per-sport data in the snapshot
+    def data_age(self, now: float = None) -> float:
+        now = now or time.time()
+        if not self.fetched_at:
+            return None
+        return round(now - min(self.fetched_at.values()), 3)
+
+    def covers_regions(self, regions: list) -> bool:
+        return set(regions).issubset(self.regions)
+
+    # Arb diffs with a sequence number greater than `since`
+    def changes_since(self, since: int = 0) -> list:
+        return [diff for diff in self.arb_changes if diff['seq'] > since]
+
+    # Per-sport freshness of the snapshot and the poller's next refresh of each sport
+    def status(self, now: float = None) -> dict:
+        now = now or time.time()
+        return {
+            'regions': list(self.regions),
+            'version': self.version,
+            'data_age': self.data_age(now),
+            'sports': {
+                sport: {
+                    'age': round(now - self.fetched_at[sport], 3) if sport in self.fetched_at else None,
+                    'next_refresh_in': round(deadline - now, 3),
+                }
+                for sport, deadline in sorted(self.next_refresh.items())
+            }
+        }
+
+# Background scheduler that keeps an in-memory odds snapshot fresh. Each sport has its own
+# refresh deadline: sports with live or soon-starting events are polled far more often than
+# sports whose next event is days away, which keeps quota usage predictable.
+class OddsPoller:
+    def __init__(self, key: str, regions: list, snapshot_file: str = None, max_workers: int = None,
+                 persist_interval: float = None):
+        self.key = key
+        self.regions = tuple(regions)
+        self.snapshot_file = snapshot_file
+        self.max_workers = max_workers
+        self.persist_interval = persist_interval  # None: never save to the snapshot store
+        self._persisted_at = None
+        self._matches_by_sport = {}
+        self._fetched_at = {}
+        self._next_refresh = {}
+        self._sports_refreshed_at = 0.0
+        self._version = 0
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        # Incremental detector turns each refresh into opened/changed/closed arb events
+        self.arb_detector = IncrementalArbDetector()
+        self._arb_changes = deque(maxlen=ARB_CHANGES_BUFFER)
+        self._change_seq = 0
+
+    @property
+    def snapshot(self) -> OddsSnapshot:
+        return self._snapshot
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # Pick the refresh interval for a sport from the soonest event in its latest odds
+    @staticmethod
+    def refresh_interval(matches: list, now: float) -> float:
+        commence_times = [match.commence_time for match in matches if match.commence_time]
+        if not commence_times:
+            return POLL_INTERVAL_IDLE
+        until_next = min(commence_times) - now
+        if until_next <= POLL_SOON_WINDOW:
+            return POLL_INTERVAL_LIVE  # Live or about to start
+        if until_next <= 24 * 60 * 60:
+            return POLL_INTERVAL_NEAR
+        return POLL_INTERVAL_FAR
+
+    # Refresh the sports list, scheduling new sports immediately and dropping removed ones
+    # (published right away, so their arbs close for every worker)
+    def _refresh_sports(self, now: float):
+        if self._next_refresh and now - self._sports_refreshed_at < SPORTS_CACHE_TTL:
+            return
+        sports = get_sports(self.key)
+        self._sports_refreshed_at = now
+        with self._lock:
+            for sport in sports:
+                self._next_refresh.setdefault(sport, now)
+            removed = set(self._next_refresh) - sports
+            for sport in removed:
+                self._next_refresh.pop(sport, None)
+                self._matches_by_sport.pop(sport, None)
+                self._fetched_at.pop(sport, None)
+        for sport in removed:
+            self._record_changes(self.arb_detector.update([], sports=[sport], current_time=now))
+        if removed:
+            self._publish()
+
+    # Run a single polling cycle and return the number of sports refreshed
+    def poll_once(self, now: float = None) -> int:
+        now = now or time.time()
+        self._refresh_sports(now)
+
+        due = [sport for sport, deadline in self._next_refresh.items() if deadline <= now]
+        if not due:
+            return 0
+
+        refreshed = set()
+        for sport, matches in fetch_odds_concurrently(self.key, due, list(self.regions), self.max_workers):
+            fetched_at = time.time()
+            with self._lock:
+                self._matches_by_sport[sport] = matches
+                self._fetched_at[sport] = fetched_at
+                self._next_refresh[sport] = fetched_at + self.refresh_interval(matches, fetched_at)
+            refreshed.add(sport)
+            self._record_changes(self.arb_detector.update(matches, sports=[sport], current_time=fetched_at))
+
+        # Keep the last good data for sports that failed and retry them shortly
+        with self._lock:
+            for sport in set(due) - refreshed:
+                self._next_refresh[sport] = now + POLL_RETRY_INTERVAL
+
+        if refreshed:
+            self._publish()
+            self._persist(now)
+        logging.info(f"Poller refreshed {len(refreshed)}/{len(due)} due sports.")
+        return len(refreshed)
+
+    # Number arb diffs and keep the most recent ones for alerting consumers
+    def _record_changes(self, diffs: list):
+        with self._lock:
+            for diff in diffs:
+                self._change_seq += 1
+                diff['seq'] = self._change_seq
+                diff['at'] = time.time()
+                self._arb_changes.append(diff)
+                if diff['type'] == 'opened':
+                    logging.info(f"Arb opened for {diff['arb']['event']}: Profit {diff['profit']}%")
+                elif diff['type'] == 'closed':
+                    logging.info(f"Arb closed for {diff['arb']['event']}")
+
+    # Swap in a new immutable snapshot and optionally persist it for other processes
+    def _publish(self):
+        with self._lock:
+            self._version += 1
+            snapshot = OddsSnapshot(
+                version=self._version,
+                regions=self.regions,
+                matches_by_sport=dict(self._matches_by_sport),
+                fetched_at=dict(self._fetched_at),
+                updated_at=time.time(),
+                next_refresh=dict(self._next_refresh),
+                arb_changes=list(self._arb_changes),
+            )
+            self._snapshot = snapshot
+        if self.snapshot_file:
+            write_snapshot_file(self.snapshot_file, snapshot)
+
+    # Save the published snapshot and its open arbs to the snapshot store, throttled to one save
+    # per persist interval, so data dumps and backtests also cover polled odds
+    def _persist(self, now: float):
+        if self.persist_interval is None:
+            return
+        if self._persisted_at is not None and now - self._persisted_at < self.persist_interval:
+            return
+        self._persisted_at = now
+        save_data_dumps(self._snapshot.all_matches(), self.arb_detector.open_arbs)
+
+    def run_forever(self):
+        logging.info(f"Odds poller started for regions {list(self.regions)}")
+        while not self._stop_event.is_set():
+            try:
+                self.poll_once()
+            except AuthenticationException as e:
+                logging.error(f"Poller authentication failed: {e}")
+                self._stop_event.wait(POLL_INTERVAL_IDLE)
+            except APIException as e:
+                logging.error(f"Poller error: {e}")
+                self._stop_event.wait(POLL_RETRY_INTERVAL)
+            except Exception:
+                logging.exception("Unexpected error in odds poller.")
+                self._stop_event.wait(POLL_RETRY_INTERVAL)
+            self._stop_event.wait(POLL_TICK)
+        logging.info("Odds poller stopped.")
+
+    def start(self):
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run_forever, name='odds-poller', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+# Shared snapshot file layout: a fixed header (magic, snapshot version, total size, metadata length),
+# a JSON metadata block, the bookmaker index as 8-byte aligned little-endian arrays, and one JSON
+# record per candidate event holding what is needed to render its arb
+SHARED_SNAPSHOT_MAGIC = b'ARBYSNP1'
+SHARED_SNAPSHOT_HEADER = struct.Struct('<8sQQQ')
+SHARED_SNAPSHOT_ARRAYS = (
+    ('commence', '<f8'),         # Commence time per candidate event
+    ('outcome_offsets', '<u8'),  # Candidate -> first ladder, candidate + 1 -> end
+    ('ladder_offsets', '<u8'),   # Ladder -> first quote, ladder + 1 -> end
+    ('prices', '<f8'),           # Quote prices, best first within each ladder
+    ('bookmaker_ids', '<u4'),    # Bit position of each quote's bookmaker title
+    ('record_offsets', '<u8'),   # Candidate -> start of its JSON record, candidate + 1 -> end
+)
+
+def _align8(size: int) -> int:
+    return (size + 7) & ~7
+
+# Atomically write a snapshot in the shared layout. The file is written under a temporary name
+# and renamed into place, so readers map either the previous version or the new one, never a
+# partial file; a reader holding the previous version keeps a valid mapping until it lets go.
+def write_snapshot_file(path: str, snapshot: OddsSnapshot):
+    index = snapshot.bookmaker_index
+    titles = [None] * len(index.bookmaker_bits)
+    for title, bit in index.bookmaker_bits.items():
+        titles[bit.bit_length() - 1] = title
+
+    columns = {name: [] for name, _ in SHARED_SNAPSHOT_ARRAYS}
+    columns['outcome_offsets'].append(0)
+    columns['ladder_offsets'].append(0)
+    columns['record_offsets'].append(0)
+    records = bytearray()
+    for match, required_outcomes, ladders in index.candidates:
+        sport_key = match.sport_key
+        event = match.event
+        columns['commence'].append(match.commence_time)
+        record_ladders = []
+        for ladder in ladders:
+            for price, bit, bookmaker in ladder:
+                columns['prices'].append(price)
+                columns['bookmaker_ids'].append(bit.bit_length() - 1)
+            columns['ladder_offsets'].append(len(columns['prices']))
+            record_ladders.append([
+                [price, bookmaker.display_title, bookmaker.bet_link(sport_key, event)]
+                for price, _, bookmaker in ladder
+            ])
+        columns['outcome_offsets'].append(len(columns['ladder_offsets']) - 1)
+        record = {
+            'sport': sport_key,
+            'event': event,
+            'date': match.date_str,
+            'outcomes': required_outcomes,
+            'ladders': record_ladders,
+        }
+        if match.market != 'h2h':
+            record.update(market=match.market, line=match.line, points=[match.point_for(name) for name in required_outcomes])
+        records += json.dumps(record).encode()
+        columns['record_offsets'].append(len(records))
+
+    arrays = [(name, np.asarray(columns[name], dtype=dtype)) for name, dtype in SHARED_SNAPSHOT_ARRAYS]
+    meta = {
+        'regions': list(snapshot.regions),
+        'fetched_at': snapshot.fetched_at,
+        'updated_at': snapshot.updated_at,
+        'bookmakers': titles,
+        'event_count': index.event_count,
+        'next_refresh': snapshot.next_refresh,
+        'arb_changes': snapshot.arb_changes,
+        'writer_pid': snapshot.writer_pid,
+        'arrays': {},
+    }
+    # Array offsets depend on the metadata length, so place them against a size-padded estimate
+    meta['arrays'] = {name: [0, array.dtype.str, len(array)] for name, array in arrays}
+    meta_length = _align8(len(json.dumps(meta)) + 32 * len(arrays))
+    offset = SHARED_SNAPSHOT_HEADER.size + meta_length
+    for name, array in arrays:
+        meta['arrays'][name][0] = offset
+        offset = _align8(offset + array.nbytes)
+    meta['records'] = offset
+    meta_bytes = json.dumps(meta).encode().ljust(meta_length)
+    total_size = offset + len(records)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(SHARED_SNAPSHOT_HEADER.pack(SHARED_SNAPSHOT_MAGIC, snapshot.version, total_size, meta_length))
+            f.write(meta_bytes)
+            for _, array in arrays:
+                data = array.tobytes()
+                f.write(data.ljust(_align8(len(data)), b'\0'))
+            f.write(records)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.error(f"Failed to write odds snapshot to {path}: {e}")
+
+# Read-only bookmaker index over a memory-mapped shared snapshot. The arrays are views of the
+# mapping (no per-worker copy); a subset query finds the first selected quote of every ladder
+# with one vectorized pass and decodes only the records of events that remain arbs.
+class SharedBookmakerIndex(BookmakerSubsetIndex):
+    def __init__(self, buffer: mmap.mmap, meta: dict):
+        self.bookmaker_bits = {title: 1 << i for i, title in enumerate(meta['bookmakers'])}
+        self.event_count = meta['event_count']
+        self._buffer = buffer
+        self._records = meta['records']
+        for name, (offset, dtype, count) in meta['arrays'].items():
+            setattr(self, f"_{name}", np.frombuffer(buffer, dtype=dtype, count=count, offset=offset))
+
+    # Same results as BookmakerSubsetIndex.query on the snapshot the file was written from
+    def query(self, mask: int, include_started_matches: bool = True, current_time: float = None, bounds=None) -> list:
+        if current_time is None:
+            current_time = time.time()
+        commence = self._commence
+        keep = np.ones(len(commence), dtype=bool)
+        if not include_started_matches:
+            keep &= commence >= current_time
+        if bounds is not None:
+            keep &= (commence >= bounds[0]) & (commence <= bounds[1])
+        rows = np.flatnonzero(keep)
+        if not len(rows):
+            return []
+
+        # Ladders are sorted best price first, so the first selected quote is the best one
+        num_quotes = len(self._prices)
+        selected = np.array([(mask >> i) & 1 for i in range(len(self.bookmaker_bits))], dtype=bool)
+        positions = np.where(selected[self._bookmaker_ids], np.arange(num_quotes), num_quotes)
+        ladder_starts = self._ladder_offsets[:-1].astype(np.intp)
+        first = np.minimum.reduceat(positions, ladder_starts)
+        found = first < self._ladder_offsets[1:]
+        inverse = np.where(found, 1.0 / self._prices[np.minimum(first, num_quotes - 1)], np.inf)
+        implied = np.add.reduceat(inverse, self._outcome_offsets[:-1].astype(np.intp))
+
+        # Screen with a little slack; survivors are re-checked with the exact Python sum below
+        arbs = []
+        for row in rows[implied[rows] < 1.0 - 1e-5 + 1e-9]:
+            start, end = self._records + int(self._record_offsets[row]), self._records + int(self._record_offsets[row + 1])
+            record = json.loads(self._buffer[start:end])
+            ladder = int(self._outcome_offsets[row])
+            best = [
+                quotes[int(first[ladder + k] - ladder_starts[ladder + k])]
+                for k, quotes in enumerate(record['ladders'])
+            ]
+            implied_probability = sum(1 / price for price, _, _ in best)
+            if implied_probability >= 1.0 - 1e-5:
+                continue
+            start_time = float(commence[row])
+            # Same shape as build_arb
+            arb = {
+                'sport': record['sport'],
+                'event': record['event'],
+                'date': record['date'],
+                'profit': round((1.0 - implied_probability) * 100, 2),
+                'is_live': start_time <= current_time and start_time != 0,
+                'odds': [
+                    {
+                        'team': outcome,
+                        'price': price,
+                        'bookmaker': bookmaker,
+                        'stake': round((1 / price) / implied_probability * 100, 2),
+                        'link': link
+                    }
+                    for outcome, (price, bookmaker, link) in zip(record['outcomes'], best)
+                ]
+            }
+            if 'market' in record:
+                label_market(arb, record['market'], record['line'], dict(zip(record['outcomes'], record['points'])).get)
+            arbs.append(arb)
+
+        arbs.sort(key=lambda x: x['profit'], reverse=True)
+        return arbs
+
+# Snapshot mapped from ODDS_SNAPSHOT_FILE. The pages are shared by every worker mapping the same
+# version of the file, so memory stays flat as workers are added. Only the bookmaker index is
+# available; the full odds of every snapshot are kept in the snapshot store.
+class SharedSnapshot(OddsSnapshot):
+    __slots__ = ()
+
+    @classmethod
+    def open(cls, path: str) -> 'SharedSnapshot':
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, total_size, meta_length = SHARED_SNAPSHOT_HEADER.unpack_from(buffer, 0)
+        if magic != SHARED_SNAPSHOT_MAGIC or total_size != len(buffer):
+            raise ValueError(f"{path} is not a complete shared odds snapshot")
+        start = SHARED_SNAPSHOT_HEADER.size
+        meta = json.loads(buffer[start:start + meta_length])
+        snapshot = cls(
+            version=version,
+            regions=tuple(meta['regions']),
+            matches_by_sport={},
+            fetched_at=meta['fetched_at'],
+            updated_at=meta['updated_at'],
+            next_refresh=meta.get('next_refresh'),
+            arb_changes=meta.get('arb_changes'),
+            writer_pid=meta.get('writer_pid'),
+        )
+        snapshot._bookmaker_index = SharedBookmakerIndex(buffer, meta)
+        return snapshot
+
+# In-process poller, if enabled, and the last snapshot mapped from ODDS_SNAPSHOT_FILE
+odds_poller = None
+_file_snapshot = None
+_file_snapshot_id = None
+_poller_lock = threading.Lock()
+_writer_lock_file = None
+_next_writer_election = 0.0
+
+# With a shared snapshot file, only the worker holding an exclusive flock on `<file>.lock` runs
+# the poller; the others serve the snapshot it publishes and retry the lock in case it exits
+def _elect_snapshot_writer() -> bool:
+    global _writer_lock_file, _next_writer_election
+    if not SNAPSHOT_FILE or fcntl is None:
+        return True
+    if _writer_lock_file is not None:
+        return True
+    now = time.monotonic()
+    if now < _next_writer_election:
+        return False
+    _next_writer_election = now + POLL_RETRY_INTERVAL
+    lock_file = open(f"{SNAPSHOT_FILE}.lock", 'a')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return False
+    _writer_lock_file = lock_file  # Held for the life of the process
+    logging.info(f"Worker {os.getpid()} is the odds snapshot writer.")
+    return True
+
+# Start the in-process poller once, when ODDS_POLLER=1
+def ensure_poller_started():
+    global odds_poller
+    if not POLLER_ENABLED or not API_KEY or (odds_poller is not None and odds_poller.running):
+        return
+    with _poller_lock:
+        if not _elect_snapshot_writer():
+            return
+        if odds_poller is None:
+            odds_poller = OddsPoller(API_KEY, map_regions(POLLER_REGIONS), snapshot_file=SNAPSHOT_FILE,
+                                     persist_interval=POLL_PERSIST_INTERVAL)
+        odds_poller.start()
+
+# Latest snapshot available to this process: the in-process poller's, or the one published to
+# ODDS_SNAPSHOT_FILE by the writer (remapped when the file is replaced by a new version)
+def current_snapshot() -> OddsSnapshot:
+    global _file_snapshot, _file_snapshot_id
+    if odds_poller is not None and odds_poller.snapshot is not None:
+        return odds_poller.snapshot
+    if not SNAPSHOT_FILE:
+        return None
+    try:
+        stat = os.stat(SNAPSHOT_FILE)
+    except OSError:
+        return None
+    file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if file_id != _file_snapshot_id:
+        try:
+            _file_snapshot = SharedSnapshot.open(SNAPSHOT_FILE)
+            _file_snapshot_id = file_id
+        except (OSError, ValueError, struct.error) as e:
+            logging.error(f"Failed to map odds snapshot from {SNAPSHOT_FILE}: {e}")
+    return _file_snapshot
+
+# Compute arbitrage opportunities from a polled snapshot instead of scanning upstream
+def get_snapshot_arbitrage(snapshot: OddsSnapshot, selected_bookmakers: list, timeframe: str) -> list:
+    index = snapshot.bookmaker_index
+    arbs = index.query(index.mask_for(selected_bookmakers), include_started_matches=False, bounds=timeframe_bounds(timeframe))
+    arbs.sort(key=lambda x: x['date'])
+    return arbs
+
 # Define the directory to store data dumps
 DATA_DUMPS_DIR = os.path.join(os.path.dirname(__file__), 'data_dumps')
 
@@ -317,19 +1954,913 @@ if not os.path.exists(DATA_DUMPS_DIR):
     os.makedirs(DATA_DUMPS_DIR)
     logging.info(f"Created data dumps directory at {DATA_DUMPS_DIR}")
 
-# API endpoint to list all data dump files
+# Path of the SQLite snapshot store that replaces the per-scan JSON dump files
+SNAPSHOT_DB_PATH = os.getenv('SNAPSHOT_DB_PATH', os.path.join(DATA_DUMPS_DIR, 'snapshots.db'))
+
+# Append-only store of fetched odds snapshots. Each snapshot is one row in `snapshots`;
+# matches and per-bookmaker quotes are stored compactly in their own tables and indexed
+# by fetch time, sport, event id and bookmaker so range queries only read the rows they need.
+class SnapshotStore:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id INTEGER PRIMARY KEY,
+            label TEXT NOT NULL UNIQUE,
+            fetched_at REAL NOT NULL,
+            match_count INTEGER NOT NULL,
+            arb_count INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_snapshots_fetched_at ON snapshots(fetched_at);
+
+        CREATE TABLE IF NOT EXISTS matches (
+            id INTEGER PRIMARY KEY,
+            snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+            fetched_at REAL NOT NULL,
+            sport_key TEXT NOT NULL,
+            event_id TEXT,
+            sport_title TEXT,
+            commence_time INTEGER NOT NULL,
+            home_team TEXT,
+            away_team TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_matches_snapshot ON matches(snapshot_id);
+        CREATE INDEX IF NOT EXISTS idx_matches_sport_time ON matches(sport_key, fetched_at);
+        CREATE INDEX IF NOT EXISTS idx_matches_event_time ON matches(event_id, fetched_at);
+        CREATE INDEX IF NOT EXISTS idx_matches_time ON matches(fetched_at);
+
+        CREATE TABLE IF NOT EXISTS quotes (
+            match_id INTEGER NOT NULL REFERENCES matches(id),
+            bookmaker_key TEXT,
+            bookmaker_title TEXT,
+            last_update INTEGER,
+            link TEXT,
+            outcomes TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_quotes_match ON quotes(match_id);
+        CREATE INDEX IF NOT EXISTS idx_quotes_bookmaker ON quotes(bookmaker_key, match_id);
+
+        CREATE TABLE IF NOT EXISTS arbs (
+            snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+            sport TEXT,
+            profit REAL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_arbs_snapshot ON arbs(snapshot_id);
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    # One connection per thread; sqlite3 connections must not be shared across threads
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    # Append a snapshot of matches (and optionally the arbs computed from it); returns its label
+    def save_snapshot(self, matches: list, arbs: list = None, fetched_at: float = None, label: str = None) -> str:
+        fetched_at = fetched_at or time.time()
+        label = label or f"data_dump_{datetime.fromtimestamp(fetched_at).strftime('%Y-%m-%d_%H-%M-%S')}"
+        arbs = arbs or []
+        conn = self._connect()
+        with self._write_lock, conn:
+            # Take the database write lock before probing labels: the thread lock only covers this
+            # process, and another worker saving in the same second must wait for our insert
+            conn.execute('BEGIN IMMEDIATE')
+            # Two scans within the same second get distinct labels
+            base_label, suffix = label, 1
+            while conn.execute('SELECT 1 FROM snapshots WHERE label = ?', (label,)).fetchone():
+                suffix += 1
+                label = f"{base_label}_{suffix}"
+
+            snapshot_id = conn.execute(
+                'INSERT INTO snapshots (label, fetched_at, match_count, arb_count) VALUES (?, ?, ?, ?)',
+                (label, fetched_at, len(matches), len(arbs))
+            ).lastrowid
+
+            for match in to_matches(matches):
+                match_id = conn.execute(
+                    'INSERT INTO matches (snapshot_id, fetched_at, sport_key, event_id, sport_title, commence_time, home_team, away_team) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (snapshot_id, fetched_at, match.sport_key, match.id, match.sport_title, match.commence_time, match.home_team, match.away_team)
+                ).lastrowid
+                conn.executemany(
+                    'INSERT INTO quotes (match_id, bookmaker_key, bookmaker_title, last_update, link, outcomes) VALUES (?, ?, ?, ?, ?, ?)',
+                    [
+                        (match_id, b.key, b.title, b.last_update, b.link,
+                         json.dumps([[name, price] for name, price in b.outcomes] + [[name, price, market, point] for market, name, price, point in b.lines],
+                                    separators=(',', ':')))
+                        for b in match.bookmakers
+                    ]
+                )
+
+            conn.executemany(
+                'INSERT INTO arbs (snapshot_id, sport, profit, data) VALUES (?, ?, ?, ?)',
+                [(snapshot_id, arb.get('sport'), arb.get('profit'), json.dumps(arb, separators=(',', ':'))) for arb in arbs]
+            )
+        return label
+
+    # Snapshot metadata, newest first, read straight from the indexed snapshots table
+    def list_snapshots(self) -> list:
+        rows = self._connect().execute(
+            'SELECT label, fetched_at, match_count, arb_count FROM snapshots ORDER BY fetched_at DESC, id DESC'
+        ).fetchall()
+        return [{'label': r[0], 'fetched_at': r[1], 'match_count': r[2], 'arb_count': r[3]} for r in rows]
+
+    def has_snapshot(self, label: str) -> bool:
+        return self._connect().execute('SELECT 1 FROM snapshots WHERE label = ?', (label,)).fetchone() is not None
+
+    # All matches of one snapshot, or None if the label is unknown
+    def load_snapshot(self, label: str) -> list:
+        row = self._connect().execute('SELECT id FROM snapshots WHERE label = ?', (label,)).fetchone()
+        if row is None:
+            return None
+        return [match for _, _, match in self.query_matches(snapshot_id=row[0])]
+
+    # Stream the matches of one snapshot; yields nothing if the label is unknown
+    def iter_snapshot(self, label: str):
+        row = self._connect().execute('SELECT id FROM snapshots WHERE label = ?', (label,)).fetchone()
+        if row is not None:
+            for _, _, match in self.query_matches(snapshot_id=row[0]):
+                yield match
+
+    # Stored arbs of one snapshot, in the order they were saved
+    def load_arbs(self, label: str) -> list:
+        rows = self._connect().execute(
+            'SELECT a.data FROM arbs a JOIN snapshots s ON s.id = a.snapshot_id WHERE s.label = ? ORDER BY a.rowid',
+            (label,)
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    # Stream (snapshot_id, fetched_at, Match) tuples in fetch-time order. Filters map onto
+    # the indexes; `bookmakers` (keys or titles) restricts which quotes are loaded.
+    def query_matches(self, sport: str = None, start: float = None, end: float = None, event_id: str = None,
+                      bookmakers: list = None, snapshot_id: int = None):
+        clauses, params = [], []
+        if snapshot_id is not None:
+            clauses.append('snapshot_id = ?')
+            params.append(snapshot_id)
+        if sport is not None:
+            clauses.append('sport_key = ?')
+            params.append(sport)
+        if event_id is not None:
+            clauses.append('event_id = ?')
+            params.append(event_id)
+        if start is not None:
+            clauses.append('fetched_at >= ?')
+            params.append(start)
+        if end is not None:
+            clauses.append('fetched_at <= ?')
+            params.append(end)
+        where = f"WHERE {' AND '.join('m.' + c for c in clauses)}" if clauses else ''
+
+        join_type, join_filter, join_params = 'LEFT JOIN', '', []
+        if bookmakers:
+            # Matches with none of the requested bookmakers are skipped entirely
+            join_type = 'JOIN'
+            placeholders = ','.join('?' * len(bookmakers))
+            join_filter = f" AND (q.bookmaker_key IN ({placeholders}) OR q.bookmaker_title IN ({placeholders}))"
+            join_params = list(bookmakers) * 2
+
+        # One ordered pass over matches joined with their quotes; rows of a match are consecutive
+        rows = self._connect().execute(
+            'SELECT m.id, m.snapshot_id, m.fetched_at, m.sport_key, m.event_id, m.sport_title, m.commence_time, '
+            'm.home_team, m.away_team, q.bookmaker_key, q.bookmaker_title, q.last_update, q.link, q.outcomes '
+            f'FROM matches m {join_type} quotes q ON q.match_id = m.id{join_filter} {where} '
+            'ORDER BY m.fetched_at, m.id, q.rowid',
+            join_params + params
+        )
+
+        current, quotes = None, []
+        for row in rows:
+            if current is not None and row[0] != current[0]:
+                yield self._build_match(current, quotes)
+                quotes = []
+            current = row
+            if row[13] is not None:
+                # h2h outcomes are stored as [name, price], other markets as [name, price, market, point]
+                entries = json.loads(row[13])
+                quotes.append(BookmakerQuote(
+                    _intern(row[9]), _intern(row[10]), row[12], row[11] or 0,
+                    tuple((sys.intern(entry[0]), entry[1]) for entry in entries if len(entry) == 2),
+                    tuple((sys.intern(entry[2]), sys.intern(entry[0]), entry[1], entry[3]) for entry in entries if len(entry) == 4)
+                ))
+        if current is not None:
+            yield self._build_match(current, quotes)
+
+    @staticmethod
+    def _build_match(row, quotes: list):
+        match = Match(row[4], _intern(row[3]), row[5], row[6], _intern(row[7]), _intern(row[8]), tuple(quotes))
+        return row[1], row[2], match
+
+    # Import a legacy JSON data dump (and its companion arbitrage dump, if present)
+    def import_json_dump(self, path: str) -> str:
+        filename = os.path.basename(path)
+        label = filename[:-len('.json')] if filename.endswith('.json') else filename
+        if self.has_snapshot(label):
+            return None
+
+        fetched_at = legacy_dump_time(path)
+        with open(path, 'r') as f:
+            matches = json.load(f)
+        if not isinstance(matches, list):
+            raise ValueError(f"{filename} does not contain a list of matches.")
+
+        arbs = []
+        arb_path = os.path.join(os.path.dirname(path), f"arbitrage_{filename}")
+        if os.path.exists(arb_path):
+            with open(arb_path, 'r') as f:
+                arbs = json.load(f)
+
+        return self.save_snapshot(matches, arbs=arbs, fetched_at=fetched_at, label=label)
+
+# Capture time of a legacy dump: the timestamp in its name, or the file's mtime
+def legacy_dump_time(path: str) -> float:
+    filename = os.path.basename(path)
+    label = filename[:-len('.json')] if filename.endswith('.json') else filename
+    timestamp = label[len('data_dump_'):]
+    try:
+        return datetime.strptime(timestamp, '%Y-%m-%d_%H-%M-%S').timestamp()
+    except ValueError:
+        return os.path.getmtime(path)
+
+# Legacy data_dump_*.json files that have not been migrated into the store, in the shape of
+# SnapshotStore.list_snapshots. Their labels keep the .json suffix, which local_arbitrage
+# resolves to the file; counts are unknown without reading the file.
+def list_legacy_dumps(store: SnapshotStore, directory: str) -> list:
+    dumps = []
+    for filename in os.listdir(directory):
+        if not (filename.startswith('data_dump_') and filename.endswith('.json')):
+            continue
+        if store.has_snapshot(filename[:-len('.json')]):
+            continue
+        path = os.path.join(directory, filename)
+        dumps.append({'label': filename, 'fetched_at': legacy_dump_time(path), 'match_count': None, 'arb_count': None})
+    return dumps
+
+# Migrate legacy data_dump_*.json files into the snapshot store, optionally deleting them afterwards
+def migrate_json_dumps(store: SnapshotStore, directory: str, remove: bool = False) -> int:
+    migrated = 0
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith('data_dump_') and filename.endswith('.json')):
+            continue
+        path = os.path.join(directory, filename)
+        try:
+            label = store.import_json_dump(path)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to migrate {filename}: {e}")
+            continue
+        if label:
+            migrated += 1
+            logging.info(f"Migrated {filename} into snapshot store as {label}")
+        if remove:
+            os.remove(path)
+            arb_path = os.path.join(directory, f"arbitrage_{filename}")
+            if os.path.exists(arb_path):
+                os.remove(arb_path)
+    return migrated
+
+snapshot_store = SnapshotStore(SNAPSHOT_DB_PATH)
+
+# Snapshot store opened by each replay worker process (sqlite connections cannot cross a fork)
+_replay_store = None
+
+def _init_replay_worker(db_path: str):
+    global _replay_store
+    _replay_store = SnapshotStore(db_path)
+
+# Identify an arb (and the match it came from) across snapshots
+def _arb_key(sport: str, event: str, date: str, market: str = 'h2h', line=None) -> tuple:
+    if market != 'h2h':
+        return (sport, event, date, market, line)
+    return (sport, event, date)
+
+# Best quoted price per (bookmaker title, outcome) of a match
+def _quote_prices(match: Match) -> dict:
+    prices = {}
+    for bookmaker in match.bookmakers:
+        for name, price in bookmaker.outcomes:
+            cell = (bookmaker.display_title, name)
+            if price and (cell not in prices or prices[cell] < price):
+                prices[cell] = price
+    return prices
+
+# Bookmakers whose quote for a leg of a closed arb dropped below the arb price or disappeared
+def _closing_bookmakers(legs: list, prices: dict) -> list:
+    closers = set()
+    for leg in legs:
+        price = prices.get((leg['bookmaker'], leg['team']))
+        if not price or price < leg['price']:
+            closers.add(leg['bookmaker'])
+    return sorted(closers)
+
+# Evaluate one stored snapshot against its own capture time
+def _evaluate_snapshot(snapshot_id: int, fetched_at: float, options: dict):
+    matches = [match for _, _, match in _replay_store.query_matches(snapshot_id=snapshot_id, sport=options['sport'])]
+    capture_time = datetime.fromtimestamp(fetched_at)
+    matches = filter_matches_by_timeframe(matches, timeframe_bounds(options['timeframe'], capture_time))
+    arbs = run_arb_engine(
+        matches,
+        include_started_matches=options['include_started_matches'],
+        selected_bookmakers=options['selected_bookmakers'],
+        current_time=fetched_at
+    )
+    matches_by_key = {_arb_key(m.sport_key, m.event, m.date_str, m.market, m.line): m for m in expand_markets(matches)}
+    return arbs, matches_by_key
+
+def _new_segment(key: tuple, fetched_at: float, legs: list, continued: bool = False) -> dict:
+    return {
+        'key': key, 'continued': continued, 'first_seen': fetched_at, 'last_seen': fetched_at,
+        'observations': 0, 'peak_profit': None, 'peak_at': None, 'bookmakers': set(),
+        'legs': legs, 'closed_at': None, 'closed_by': []
+    }
+
+# Replay a contiguous run of snapshots in time order and return arb lifetime segments.
+# The snapshot before the chunk (if any) is evaluated first to seed arbs that were already
+# open, so segments can be stitched across chunk boundaries by the parent process. For
+# matches the chunk has not seen an arb on yet, the first arb-free sighting is reported too,
+# which lets the parent close lifetimes left open by earlier chunks.
+def _replay_chunk(task: tuple):
+    previous, chunk, options = task
+    open_segments = {}
+    finished = []
+    segmented_keys = set()
+    first_absent = {}
+
+    if previous is not None:
+        prev_arbs, _ = _evaluate_snapshot(previous[0], previous[1], options)
+        for arb in prev_arbs:
+            key = _arb_key(arb['sport'], arb['event'], arb['date'], arb.get('market', 'h2h'), arb.get('point'))
+            open_segments[key] = _new_segment(key, previous[1], arb['odds'], continued=True)
+            segmented_keys.add(key)
+
+    for snapshot_id, fetched_at in chunk:
+        arbs, matches_by_key = _evaluate_snapshot(snapshot_id, fetched_at, options)
+        seen = set()
+        for arb in arbs:
+            key = _arb_key(arb['sport'], arb['event'], arb['date'], arb.get('market', 'h2h'), arb.get('point'))
+            seen.add(key)
+            segmented_keys.add(key)
+            segment = open_segments.get(key)
+            if segment is None:
+                segment = open_segments[key] = _new_segment(key, fetched_at, arb['odds'])
+            segment['last_seen'] = fetched_at
+            segment['observations'] += 1
+            segment['legs'] = arb['odds']
+            segment['bookmakers'].update(leg['bookmaker'] for leg in arb['odds'])
+            if segment['peak_profit'] is None or arb['profit'] > segment['peak_profit']:
+                segment['peak_profit'] = arb['profit']
+                segment['peak_at'] = fetched_at
+
+        # An arb closes when its match is still quoted but no longer arbitrageable; matches
+        # missing from a snapshot (sport not fetched, out of timeframe) leave the arb open
+        for key in [key for key in open_segments if key not in seen]:
+            match = matches_by_key.get(key)
+            if match is None:
+                continue
+            segment = open_segments.pop(key)
+            segment['closed_at'] = fetched_at
+            segment['closed_by'] = _closing_bookmakers(segment['legs'], _quote_prices(match))
+            finished.append(segment)
+
+        for key, match in matches_by_key.items():
+            if key not in seen and key not in segmented_keys and key not in first_absent:
+                first_absent[key] = (fetched_at, _quote_prices(match))
+
+    finished.extend(open_segments.values())
+    finished.sort(key=lambda segment: segment['first_seen'])
+    return finished, first_absent
+
+# Stitch a segment from a later chunk onto the lifetime it continues
+def _merge_segment(lifetime: dict, segment: dict):
+    lifetime['last_seen'] = max(lifetime['last_seen'], segment['last_seen'])
+    lifetime['observations'] += segment['observations']
+    lifetime['bookmakers'] |= segment['bookmakers']
+    lifetime['legs'] = segment['legs']
+    if segment['peak_profit'] is not None and (lifetime['peak_profit'] is None or segment['peak_profit'] > lifetime['peak_profit']):
+        lifetime['peak_profit'] = segment['peak_profit']
+        lifetime['peak_at'] = segment['peak_at']
+    lifetime['closed_at'] = segment['closed_at']
+    lifetime['closed_by'] = segment['closed_by']
+
+# Replay stored snapshots between start and end (epoch seconds) across a process pool and
+# return per-arb lifetime statistics: first/last seen, peak profit and the closing bookmakers.
+def replay_snapshots(store: SnapshotStore, start: float = None, end: float = None, sport: str = None,
+                     selected_bookmakers: list = None, timeframe: str = None,
+                     include_started_matches: bool = False, workers: int = None) -> list:
+    clauses, params = [], []
+    if start is not None:
+        clauses.append('fetched_at >= ?')
+        params.append(start)
+    if end is not None:
+        clauses.append('fetched_at <= ?')
+        params.append(end)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    snapshots = store._connect().execute(
+        f'SELECT id, fetched_at FROM snapshots {where} ORDER BY fetched_at, id', params
+    ).fetchall()
+    if not snapshots:
+        return []
+
+    options = {
+        'sport': sport,
+        'selected_bookmakers': selected_bookmakers,
+        'timeframe': timeframe,
+        'include_started_matches': include_started_matches,
+    }
+
+    # Several chunks per worker keeps the pool busy when snapshot sizes vary
+    workers = max(1, workers or os.cpu_count() or 1)
+    chunk_size = max(1, -(-len(snapshots) // (workers * 4)))
+    tasks = []
+    for i in range(0, len(snapshots), chunk_size):
+        previous = snapshots[i - 1] if i > 0 else None
+        tasks.append((previous, snapshots[i:i + chunk_size], options))
+
+    logging.info(f"Replaying {len(snapshots)} snapshots in {len(tasks)} chunks across {workers} workers")
+    lifetimes = []
+    open_lifetimes = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_replay_worker, initargs=(store.path,)) as executor:
+        # map() yields chunk results in time order, so segments can be stitched as they arrive
+        for segments, first_absent in executor.map(_replay_chunk, tasks):
+            continued = {segment['key'] for segment in segments if segment['continued']}
+            first_segment = {}
+            for segment in segments:
+                if not segment['continued']:
+                    first_segment.setdefault(segment['key'], segment)
+
+            # Lifetimes the chunk could not see: close them at their first arb-free sighting,
+            # or extend them with the chunk's first segment if the arb shows up again first
+            consumed = set()
+            for key, lifetime in list(open_lifetimes.items()):
+                if key in continued:
+                    continue
+                absent = first_absent.get(key)
+                segment = first_segment.get(key)
+                if absent is not None and (segment is None or absent[0] < segment['first_seen']):
+                    lifetime['closed_at'] = absent[0]
+                    lifetime['closed_by'] = _closing_bookmakers(lifetime['legs'], absent[1])
+                    del open_lifetimes[key]
+                elif segment is not None:
+                    _merge_segment(lifetime, segment)
+                    consumed.add(id(segment))
+                    if lifetime['closed_at'] is not None:
+                        del open_lifetimes[key]
+
+            for segment in segments:
+                key = segment['key']
+                if id(segment) in consumed:
+                    continue
+                if segment['continued']:
+                    lifetime = open_lifetimes.pop(key, None)
+                    if lifetime is None:
+                        continue
+                    _merge_segment(lifetime, segment)
+                else:
+                    lifetime = segment
+                    lifetimes.append(lifetime)
+                if lifetime['closed_at'] is None:
+                    open_lifetimes[key] = lifetime
+
+    results = []
+    for lifetime in lifetimes:
+        # Keys of spreads and totals arbs also carry the market and line (see _arb_key)
+        key = lifetime['key']
+        sport_key, event, date = key[:3]
+        results.append({
+            'sport': sport_key,
+            'event': event,
+            'date': date,
+            'market': key[3] if len(key) > 3 else 'h2h',
+            'point': key[4] if len(key) > 3 else None,
+            'first_seen': lifetime['first_seen'],
+            'last_seen': lifetime['last_seen'],
+            'duration': round(lifetime['last_seen'] - lifetime['first_seen'], 3),
+            'observations': lifetime['observations'],
+            'peak_profit': lifetime['peak_profit'],
+            'peak_at': lifetime['peak_at'],
+            'bookmakers': sorted(lifetime['bookmakers']),
+            'closed_at': lifetime['closed_at'],
+            'closed_by': lifetime['closed_by'],
+        })
+    results.sort(key=lambda x: (x['first_seen'], x['sport'], x['event'], x['market'], x['point'] or 0))
+    return results
+
+# Command line entry point for offline backtests: `python app.py backtest [options]`
+def run_backtest_cli(argv: list):
+    parser = argparse.ArgumentParser(prog='app.py backtest', description='Replay stored odds snapshots and report arb lifetimes.')
+    parser.add_argument('--start', help="Earliest capture time, 'YYYY-MM-DD[ HH:MM:SS]'")
+    parser.add_argument('--end', help="Latest capture time, 'YYYY-MM-DD[ HH:MM:SS]'")
+    parser.add_argument('--sport', help='Only replay this sport key')
+    parser.add_argument('--bookmakers', help='Comma-separated bookmaker titles to consider')
+    parser.add_argument('--timeframe', choices=['today', 'week', 'month'], help='Timeframe filter relative to each capture time')
+    parser.add_argument('--include-started', action='store_true', help='Also evaluate matches that had already started')
+    parser.add_argument('--workers', type=int, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--output', help='Write the lifetimes as JSON to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    def parse_time(value):
+        if not value:
+            return None
+        fmt = '%Y-%m-%d %H:%M:%S' if ' ' in value else '%Y-%m-%d'
+        return datetime.strptime(value, fmt).timestamp()
+
+    started = time.monotonic()
+    lifetimes = replay_snapshots(
+        snapshot_store,
+        start=parse_time(args.start),
+        end=parse_time(args.end),
+        sport=args.sport,
+        selected_bookmakers=[b.strip() for b in args.bookmakers.split(',')] if args.bookmakers else None,
+        timeframe=args.timeframe,
+        include_started_matches=args.include_started,
+        workers=args.workers
+    )
+    logging.info(f"Backtest found {len(lifetimes)} arb lifetimes in {time.monotonic() - started:.1f}s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(lifetimes, f, indent=2)
+    else:
+        json.dump(lifetimes, sys.stdout, indent=2)
+
+# Save fetched matches and arbitrage opportunities as one snapshot in the store
+def save_data_dumps(fetched_matches: list, arbitrage_opportunities: list):
+    try:
+        start = time.perf_counter()
+        label = snapshot_store.save_snapshot(fetched_matches, arbs=arbitrage_opportunities)
+        dump_write_seconds.observe(time.perf_counter() - start)
+        logging.info(f"Saved {len(fetched_matches)} matches and {len(arbitrage_opportunities)} arbs to snapshot {label}")
+    except Exception as e:
+        logging.error(f"Failed to save snapshot: {e}")
+
+# API endpoint to list all stored snapshots (data dumps), newest first
 @app.route('/api/list_data_dumps', methods=['GET'])
 def list_data_dumps():
     try:
-        files = os.listdir(DATA_DUMPS_DIR)
-        json_files = [file for file in files if file.endswith('.json')]
-        # Sort files by modification time descending
-        json_files.sort(key=lambda x: os.path.getmtime(os.path.join(DATA_DUMPS_DIR, x)), reverse=True)
-        return jsonify({"data_dumps": json_files})
+        # Legacy JSON dumps stay selectable until `python app.py migrate_dumps` moves them into the store
+        snapshots = snapshot_store.list_snapshots() + list_legacy_dumps(snapshot_store, DATA_DUMPS_DIR)
+        snapshots.sort(key=lambda snapshot: snapshot['fetched_at'], reverse=True)
+        return jsonify({"data_dumps": [snapshot['label'] for snapshot in snapshots], "snapshots": snapshots})
     except Exception as e:
         logging.error(f"Error listing data dumps: {e}")
         return jsonify({"error": "Failed to list data dumps."}), 500
 
+# Bookmaker indexes of recently queried data dumps, capped by count (LOCAL_INDEX_CACHE_SIZE entries)
+LOCAL_INDEX_CACHE_SIZE = int(os.getenv('LOCAL_INDEX_CACHE_SIZE', '8'))
+LOCAL_INDEX_CACHE_TTL = float(os.getenv('LOCAL_INDEX_CACHE_TTL', str(60 * 60)))
+local_index_cache = TTLCache(max_entries=LOCAL_INDEX_CACHE_SIZE)
+
+# Longest time a data dump's arb list is reused. A list also expires when its first arb's match
+# starts or the day ends, whichever comes first, so cached results are never stale.
+LOCAL_ARBS_CACHE_TTL = float(os.getenv('LOCAL_ARBS_CACHE_TTL', str(60 * 60)))
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_DELIMITERS = frozenset(' \t\n\r,]')
+
+# Decode the elements of a top-level JSON array one at a time, reading the file in chunks, so
+# memory holds one element and a chunk rather than the whole document. Raises ValueError if the
+# document is not an array and json.JSONDecodeError if it is malformed.
+def iter_json_array(f, chunk_size: int = 1 << 16):
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+    state = 'start'  # 'start', 'first' (value or ']'), 'value', 'next' (',' or ']')
+    while True:
+        pos = _JSON_WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                raise json.JSONDecodeError("Unexpected end of data dump", buffer, pos)
+            chunk = f.read(chunk_size)
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+
+        char = buffer[pos]
+        if state == 'start':
+            if char != '[':
+                raise ValueError("Data dump does not contain a list of matches.")
+            pos, state = pos + 1, 'first'
+        elif char == ']' and state in ('first', 'next'):
+            return
+        elif state == 'next':
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos, state = pos + 1, 'value'
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # A value that fails or is not followed by a delimiter may be cut off (a number split
+            # across chunks decodes as a shorter number); read on and retry. Reads grow with the
+            # buffer so an element spanning many chunks is decoded in linear time.
+            if end is None or (not eof and buffer[end:end + 1] not in _JSON_DELIMITERS):
+                chunk = f.read(max(chunk_size, len(buffer) - pos))
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+            yield value
+            pos, state = end, 'next'
+
+# Stream the matches of a data dump that have not started by `current_time`, from the snapshot
+# store or a legacy JSON file. Started events are dropped before they are normalized, so neither
+# the raw dump nor matches that can no longer be bet on are held in memory.
+def iter_local_matches(label: str, file_path: str, in_store: bool, current_time: float):
+    if in_store:
+        for match in snapshot_store.iter_snapshot(label):
+            if match.commence_time >= current_time:
+                yield match
+        return
+    with open(file_path, 'r') as f:
+        for raw in iter_json_array(f):
+            if int(raw.get('commence_time') or 0) >= current_time:
+                yield Match.from_dict(raw)
+
+# Seconds a data dump's arb list stays valid: until the first listed match starts (it then leaves
+# the list) or the day ends (timeframes move), capped at LOCAL_ARBS_CACHE_TTL
+def local_arbs_ttl(arbs: list, current_time: datetime) -> float:
+    end_of_day = (current_time + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    expires = end_of_day.timestamp()
+    if arbs:
+        first = min(arb['date'] for arb in arbs)  # '%Y-%m-%d %H:%M:%S' sorts chronologically
+        expires = min(expires, datetime.strptime(first, '%Y-%m-%d %H:%M:%S').timestamp())
+    return max(0.0, min(LOCAL_ARBS_CACHE_TTL, expires - current_time.timestamp()))
+
+# Sorted arb lists with their content digest, keyed on (endpoint, data version, filters, sort)
+arbs_response_cache = TTLCache(max_bytes=ARBS_RESPONSE_CACHE_MAX_BYTES)
+
+# Server-side sort options for arb lists. Keys are total orders (ties broken by date, sport,
+# event, market and line) so a cursor, the key of the last arb on a page, always resumes at the
+# right place.
+ARB_SORT_KEYS = {
+    'profit': lambda arb: (arb['profit'], arb['date'], arb['sport'], arb['event'], arb.get('market', 'h2h'), arb.get('point') or 0),
+    'date': lambda arb: (arb['date'], -arb['profit'], arb['sport'], arb['event'], arb.get('market', 'h2h'), arb.get('point') or 0),
+    'sport': lambda arb: (arb['sport'], arb['date'], -arb['profit'], arb['event'], arb.get('market', 'h2h'), arb.get('point') or 0),
+}
+ARB_SORT_DEFAULT_ORDER = {'profit': 'desc', 'date': 'asc', 'sport': 'asc'}
+# Element types of each sort key, used to reject cursors that could not have come from it
+ARB_SORT_KEY_TYPES = {
+    'profit': ('number', 'str', 'str', 'str', 'str', 'number'),
+    'date': ('str', 'number', 'str', 'str', 'str', 'number'),
+    'sport': ('str', 'str', 'number', 'str', 'str', 'number'),
+}
+
+def _cursor_matches(cursor: tuple, sort: str) -> bool:
+    types = ARB_SORT_KEY_TYPES[sort]
+    if len(cursor) != len(types):
+        return False
+    for value, kind in zip(cursor, types):
+        if kind == 'number' and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            return False
+        if kind == 'str' and not isinstance(value, str):
+            return False
+    return True
+
+# Read the sort, order, limit and cursor query parameters; raises ValueError when they are invalid
+def parse_arb_page_args(default_sort: str) -> dict:
+    sort = request.args.get('sort', default_sort)
+    if sort not in ARB_SORT_KEYS:
+        raise ValueError(f"Invalid sort '{sort}'; expected one of {', '.join(ARB_SORT_KEYS)}.")
+    order = request.args.get('order', ARB_SORT_DEFAULT_ORDER[sort])
+    if order not in ('asc', 'desc'):
+        raise ValueError("Invalid order; expected 'asc' or 'desc'.")
+    limit = request.args.get('limit')
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError as e:
+            raise ValueError("limit must be a positive integer.") from e
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer.")
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            cursor = tuple(json.loads(base64.urlsafe_b64decode(cursor.encode())))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor.") from e
+        if not _cursor_matches(cursor, sort):
+            raise ValueError("Invalid cursor.")
+    return {'sort': sort, 'order': order, 'limit': limit, 'cursor': cursor or None}
+
+# Slice one page after the cursor from a sorted arb list; returns the page and the next cursor
+def paginate_arbs(arbs: list, sort: str, descending: bool, cursor: tuple = None, limit: int = None):
+    key = ARB_SORT_KEYS[sort]
+    start = 0
+    if cursor is not None:
+        start = len(arbs)
+        for i, arb in enumerate(arbs):
+            arb_key = key(arb)
+            if (arb_key < cursor) if descending else (arb_key > cursor):
+                start = i
+                break
+    end = len(arbs) if limit is None else min(start + limit, len(arbs))
+    page = arbs[start:end]
+    next_cursor = None
+    if end < len(arbs) and page:
+        next_cursor = base64.urlsafe_b64encode(json.dumps(key(page[-1])).encode()).decode()
+    return page, next_cursor
+
+# Build a paginated arb list response with a weak ETag. `version` identifies the data the arbs
+# come from (None when every call produces fresh data); with a version, the sorted list is reused
+# from arbs_response_cache so unchanged data is answered with 304 without being recomputed.
+# `compute` returns the unsorted arbs, `ttl` (called with them) how long the list may be reused
+# instead of ARBS_RESPONSE_CACHE_TTL, and `extra` adds fields to the response body.
+def arbs_response(version, filters: tuple, page_args: dict, compute, extra: dict = None, ttl=None):
+    sort, order = page_args['sort'], page_args['order']
+    cache_key = (request.path, version, filters, sort, order)
+    entry = arbs_response_cache.get(cache_key) if version is not None else None
+    if entry is None:
+        arbs = sorted(compute(), key=ARB_SORT_KEYS[sort], reverse=order == 'desc')
+        body = json.dumps(arbs, sort_keys=True).encode()
+        entry = (hashlib.sha1(body).hexdigest()[:16], arbs)
+        if version is not None:
+            arbs_response_cache.set(cache_key, entry, ARBS_RESPONSE_CACHE_TTL if ttl is None else ttl(arbs), size=len(body))
+    digest, arbs = entry
+
+    cursor, limit = page_args['cursor'], page_args['limit']
+    page_digest = hashlib.sha1(json.dumps([digest, sort, order, cursor, limit]).encode()).hexdigest()[:16]
+    etag = f"{version or 'live'}-{page_digest}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        page, next_cursor = paginate_arbs(arbs, sort, order == 'desc', cursor, limit)
+        response = jsonify({"arbs": page, "next_cursor": next_cursor, "total": len(arbs), **(extra or {})})
+    # Weak because fields such as data_age may differ while the arbs are the same
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+# Compress JSON responses for clients that accept it (brotli when installed, otherwise gzip)
+@app.after_request
+def compress_response(response):
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or response.mimetype != 'application/json' or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    if brotli is not None and request.accept_encodings['br']:
+        response.set_data(brotli.compress(data))
+        response.headers['Content-Encoding'] = 'br'
+    elif request.accept_encodings['gzip']:
+        response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+# Make sure the background poller is running before serving requests (no-op unless ODDS_POLLER=1)
+@app.before_request
+def start_background_poller():
+    ensure_poller_started()
+
+# Whether the poller that wrote `snapshot` is still running: the in-process poller's thread, or
+# the writer process of a snapshot mapped from ODDS_SNAPSHOT_FILE
+def poller_running(snapshot: OddsSnapshot) -> bool:
+    if odds_poller is not None:
+        return odds_poller.running
+    if snapshot is None:
+        return False
+    try:
+        os.kill(snapshot.writer_pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+# API endpoint to report the background poller's per-sport freshness. Every worker reads the
+# published snapshot, so the writer and the workers mapping its file report the same status.
+@app.route('/api/poller_status', methods=['GET'])
+def poller_status():
+    snapshot = current_snapshot()
+    status = snapshot.status() if snapshot else {'version': 0, 'data_age': None}
+    status['running'] = poller_running(snapshot)
+    return jsonify(status)
+
+# API endpoint for alerting: arb opened/changed/closed events from the poller after sequence `since`,
+# served from the published snapshot so every worker returns the same diff stream
+@app.route('/api/arb_changes', methods=['GET'])
+def arb_changes():
+    since = request.args.get('since', 0, type=int)
+    snapshot = current_snapshot()
+    return jsonify({"changes": snapshot.changes_since(since) if snapshot else [], "running": poller_running(snapshot)})
+
+# API endpoint exposing the remaining odds API quota and rate governor counters
+@app.route('/api/quota', methods=['GET'])
+def quota():
+    return jsonify(rate_governor.quota())
+
+# Time every API request for arby_http_request_seconds; endpoints are labelled by URL rule
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_latency(response):
+    start = g.get('request_start')
+    if start is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        http_request_seconds.observe(time.perf_counter() - start, endpoint=endpoint, method=request.method, status=response.status_code)
+    return response
+
+# Prometheus scrape endpoint; quota and cache figures are sampled at scrape time
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    quota = rate_governor.quota()
+    if quota['requests_remaining'] is not None:
+        odds_quota_remaining.set(quota['requests_remaining'])
+    if quota['requests_used'] is not None:
+        odds_quota_used.set(quota['requests_used'])
+    cache = response_cache.stats()
+    response_cache_events.set(cache['hits'], result='hit')
+    response_cache_events.set(cache['misses'], result='miss')
+    response_cache_events.set(cache['evictions'], result='eviction')
+    response_cache_bytes.set(cache['bytes'])
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+# Only one profiled scan runs at a time
+_profile_lock = threading.Lock()
+
+# Opt-in (ARBY_PROFILING=1) endpoint that runs one live scan under the sampling profiler and
+# returns folded stacks. Odds still in the response cache are not refetched during the scan.
+@app.route('/api/profile_scan', methods=['GET'])
+def profile_scan():
+    if not PROFILING_ENABLED:
+        return jsonify({"error": "Profiling is disabled; set ARBY_PROFILING=1 to enable it."}), 404
+    if not API_KEY:
+        logging.error("API key not found in environment variables.")
+        return jsonify({"error": "API key not found."}), 500
+
+    timeframe = request.args.get('timeframe', 'today')
+    regions = request.args.getlist('regions')
+    selected_bookmakers = request.args.getlist('bookmakers')
+    interval = request.args.get('interval', PROFILE_SAMPLE_INTERVAL, type=float)
+
+    if not _profile_lock.acquire(blocking=False):
+        return jsonify({"error": "A profiled scan is already running."}), 409
+    try:
+        profiler = SamplingProfiler(max(interval, 0.001))
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            arbs, matches = get_arbitrage_opportunities(API_KEY, regions if regions else DEFAULT_REGIONS, selected_bookmakers, 0, timeframe)
+        finally:
+            profiler.stop()
+        duration = time.perf_counter() - start
+    finally:
+        _profile_lock.release()
+
+    logging.info(f"Profiled scan took {duration:.3f}s with {profiler.samples} samples")
+    headers = {
+        'X-Profile-Samples': str(profiler.samples),
+        'X-Scan-Duration': f"{duration:.3f}",
+        'X-Scan-Matches': str(len(matches)),
+        'X-Scan-Arbs': str(len(arbs)),
+    }
+    return Response(profiler.folded(), mimetype='text/plain', headers=headers)
+
+# API endpoint to inspect the upstream response cache
+@app.route('/api/cache_stats', methods=['GET'])
+def cache_stats():
+    return jsonify({**response_cache.stats(), 'single_flight': arbitrage_flights.stats()})
+
+# Coalesces identical live scans from concurrent /api/arbitrage and /api/arbitrage/stream requests
+arbitrage_flights = SingleFlight(lock_dir=SINGLE_FLIGHT_DIR)
+
+# Normalize live scan parameters so equivalent requests map to the same single-flight key
+def arbitrage_flight_key(regions: list, selected_bookmakers: list, timeframe: str) -> tuple:
+    if timeframe not in ('today', 'week', 'month'):
+        timeframe = 'all'
+    return ('arbitrage', timeframe, tuple(sorted(set(map_regions(regions)))), tuple(sorted(set(selected_bookmakers))))
+
+# Run one live scan and save its data dump, returning the arbitrage opportunities
+def run_live_scan(regions: list, selected_bookmakers: list, timeframe: str) -> list:
+    # Retrieve arbitrage opportunities and all fetched matches
+    arbitrage_opportunities, fetched_matches = get_arbitrage_opportunities(
+        key=API_KEY,
+        regions=regions,
+        selected_bookmakers=selected_bookmakers,
+        cutoff=0,  # Set minimum profit margin (0 means no cutoff)
+        timeframe=timeframe
+    )
+
+    if arbitrage_opportunities:
+        logging.info(f"Total arbitrage opportunities found: {len(arbitrage_opportunities)}")
+    else:
+        logging.info("No arbitrage opportunities found.")
+
+    # Save all fetched matches and the arbitrage opportunities to timestamped data dumps
+    save_data_dumps(fetched_matches, arbitrage_opportunities)
+
+    return arbitrage_opportunities
+
 # API endpoint to retrieve arbitrage opportunities from live API data
 @app.route('/api/arbitrage', methods=['GET'])
 def get_arbitrage():
@@ -344,45 +2875,172 @@ def get_arbitrage():
     logging.info(f"Received request for live arbitrage with timeframe={timeframe}, regions={regions}, bookmakers={selected_bookmakers}")
 
     try:
-        # Retrieve arbitrage opportunities and all fetched matches
-        arbitrage_opportunities, fetched_matches = get_arbitrage_opportunities(
-            key=API_KEY,
-            regions=regions if regions else DEFAULT_REGIONS,
-            selected_bookmakers=selected_bookmakers,
-            cutoff=0,  # Set minimum profit margin (0 means no cutoff)
-            timeframe=timeframe
+        page_args = parse_arb_page_args(default_sort='date')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    flight_key = arbitrage_flight_key(regions if regions else DEFAULT_REGIONS, selected_bookmakers, timeframe)
+
+    # Answer from the background poller's snapshot when it covers the requested regions
+    snapshot = current_snapshot()
+    if snapshot is not None and snapshot.covers_regions(map_regions(regions if regions else DEFAULT_REGIONS)):
+        logging.info(f"Serving arbitrage opportunities from snapshot v{snapshot.version}")
+        return arbs_response(
+            f"v{snapshot.version}.{int(snapshot.updated_at * 1000)}",
+            flight_key,
+            page_args,
+            lambda: get_snapshot_arbitrage(snapshot, selected_bookmakers, timeframe),
+            extra={"data_age": snapshot.data_age(), "snapshot_version": snapshot.version}
+        )
+
+    try:
+        # Concurrent requests with equivalent parameters share one upstream scan
+        return arbs_response(
+            None,
+            flight_key,
+            page_args,
+            lambda: arbitrage_flights.do(
+                flight_key,
+                lambda: run_live_scan(regions if regions else DEFAULT_REGIONS, selected_bookmakers, timeframe)
+            )
         )
     except Exception as e:
         logging.exception("An unexpected error occurred while fetching arbs.")
         return jsonify({"error": "An unexpected error occurred."}), 500
 
-    if arbitrage_opportunities:
-        logging.info(f"Total arbitrage opportunities found: {len(arbitrage_opportunities)}")
-    else:
-        logging.info("No arbitrage opportunities found.")
+# Format a single Server-Sent Events message
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+# API endpoint to stream live arbitrage opportunities per sport as Server-Sent Events.
+# Emits an 'arb' event for every opportunity as soon as its sport's odds arrive, a
+# 'progress' event per completed sport, and a final 'summary' event ('scan_error' on failure).
+# When the poller's snapshot covers the regions the arbs come from it, with no upstream calls.
+# Otherwise the scan runs as a single-flight call shared with /api/arbitrage: requests that
+# join a scan already in flight receive its arbs when it finishes.
+@app.route('/api/arbitrage/stream', methods=['GET'])
+def stream_arbitrage():
+    if not API_KEY:
+        logging.error("API key not found in environment variables.")
+        return jsonify({"error": "API key not found."}), 500
 
-    # Save all fetched matches to a single data dump file with timestamp
-    try:
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        filename = f"data_dump_{timestamp}.json"
-        file_path = os.path.join(DATA_DUMPS_DIR, filename)
-        with open(file_path, 'w') as f:
-            json.dump(fetched_matches, f, indent=2)
-        logging.info(f"Saved all fetched data to {file_path}")
-    except Exception as e:
-        logging.error(f"Failed to save fetched data to file: {e}")
+    timeframe = request.args.get('timeframe', 'today')
+    regions = request.args.getlist('regions')  # Get regions from query parameters
+    selected_bookmakers = request.args.getlist('bookmakers')  # Get selected bookmakers from query parameters
 
-    # Also save the arbitrage opportunities to a separate file if desired
-    try:
-        arb_filename = f"arbitrage_data_dump_{timestamp}.json"
-        arb_file_path = os.path.join(DATA_DUMPS_DIR, arb_filename)
-        with open(arb_file_path, 'w') as f:
-            json.dump(arbitrage_opportunities, f, indent=2)
-        logging.info(f"Saved arbitrage data to {arb_file_path}")
-    except Exception as e:
-        logging.error(f"Failed to save arbitrage data to file: {e}")
+    logging.info(f"Received request for streamed arbitrage with timeframe={timeframe}, regions={regions}, bookmakers={selected_bookmakers}")
 
-    return jsonify({"arbs": arbitrage_opportunities})
+    def generate():
+        scan_start = time.monotonic()
+        mapped_regions = map_regions(regions if regions else DEFAULT_REGIONS)
+        if not mapped_regions:
+            yield sse_event('scan_error', {'error': 'No valid regions provided.'})
+            return
+
+        snapshot = current_snapshot()
+        if snapshot is not None and snapshot.covers_regions(mapped_regions):
+            logging.info(f"Streaming arbitrage opportunities from snapshot v{snapshot.version}")
+            arbs = get_snapshot_arbitrage(snapshot, selected_bookmakers, timeframe)
+            for arb in arbs:
+                yield sse_event('arb', arb)
+            yield sse_event('summary', {
+                'total_arbs': len(arbs),
+                'sports_scanned': len(snapshot.fetched_at),
+                'sports_total': len(snapshot.fetched_at),
+                'matches': snapshot.bookmaker_index.event_count,
+                'duration': round(time.monotonic() - scan_start, 3),
+                'data_age': snapshot.data_age(),
+                'snapshot_version': snapshot.version
+            })
+            return
+
+        # The scan runs on its own thread and hands arb and progress events to this generator
+        updates = queue.Queue()
+        finished = object()
+        scan_stats = {}
+        outcome = {}
+
+        def scan() -> list:
+            bounds = timeframe_bounds(timeframe)
+            sports = plan_sports(API_KEY, get_sports(API_KEY), bounds)
+            fetched_matches = []
+            arbitrage_opportunities = []
+            sports_scanned = 0
+            for sport, matches in fetch_odds_concurrently(API_KEY, sports, mapped_regions):
+                matches = filter_matches_by_timeframe(matches, bounds)
+                fetched_matches.extend(matches)
+                sports_scanned += 1
+
+                # Evaluate this sport immediately so its arbs reach the client without waiting for the full scan
+                arbs = run_arb_engine(matches, include_started_matches=False, selected_bookmakers=selected_bookmakers)
+                for arb in arbs:
+                    updates.put(('arb', arb))
+                arbitrage_opportunities.extend(arbs)
+
+                updates.put(('progress', {
+                    'sport': sport,
+                    'matches': len(matches),
+                    'arbs': len(arbs),
+                    'sports_scanned': sports_scanned,
+                    'sports_total': len(sports)
+                }))
+
+            arbitrage_opportunities.sort(key=lambda x: x['date'])
+            scan_arbs_found.observe(len(arbitrage_opportunities), scan='stream')
+            save_data_dumps(fetched_matches, arbitrage_opportunities)
+            scan_stats.update(sports_scanned=sports_scanned, sports_total=len(sports), matches=len(fetched_matches))
+            return arbitrage_opportunities
+
+        def run():
+            try:
+                flight_key = arbitrage_flight_key(regions if regions else DEFAULT_REGIONS, selected_bookmakers, timeframe)
+                outcome['arbs'] = arbitrage_flights.do(flight_key, scan)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                updates.put(finished)
+
+        threading.Thread(target=run, name='stream-scan', daemon=True).start()
+        while True:
+            update = updates.get()
+            if update is finished:
+                break
+            yield sse_event(*update)
+
+        error = outcome.get('error')
+        if isinstance(error, AuthenticationException):
+            logging.error(f"Aborting streamed scan: {error}")
+            yield sse_event('scan_error', {'error': 'Failed to authenticate with the odds API.'})
+            return
+        if isinstance(error, APIException):
+            logging.error(f"Error fetching sports: {error}")
+            yield sse_event('scan_error', {'error': 'Failed to fetch sports.'})
+            return
+        if error is not None:
+            logging.error(f"Streamed scan failed: {error}")
+            yield sse_event('scan_error', {'error': 'An unexpected error occurred.'})
+            return
+
+        # A scan shared with another request ran elsewhere: send its arbs now
+        arbs = outcome['arbs']
+        if not scan_stats:
+            for arb in arbs:
+                yield sse_event('arb', arb)
+
+        yield sse_event('summary', {
+            'total_arbs': len(arbs),
+            'sports_scanned': scan_stats.get('sports_scanned'),
+            'sports_total': scan_stats.get('sports_total'),
+            'matches': scan_stats.get('matches'),
+            'duration': round(time.monotonic() - scan_start, 3),
+            'shared': not scan_stats
+        })
+
+    headers = {
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Disable proxy buffering so events are flushed immediately
+    }
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers=headers)
 
 # API endpoint to retrieve arbitrage opportunities from local file data
 @app.route('/api/local_arbitrage', methods=['GET'])
@@ -397,61 +3055,54 @@ def get_local_arbitrage():
         logging.error("No filename provided for local arbitrage.")
         return jsonify({'error': 'No filename provided.'}), 400
 
-    # Ensure the filename is secure and exists
+    # Ensure the filename is secure and exists, either as a stored snapshot or a legacy JSON dump
     safe_filename = os.path.basename(filename)
+    label = safe_filename[:-len('.json')] if safe_filename.endswith('.json') else safe_filename
     file_path = os.path.join(DATA_DUMPS_DIR, safe_filename)
+    in_store = snapshot_store.has_snapshot(label)
 
-    if not os.path.exists(file_path):
+    if not in_store and not os.path.exists(file_path):
         logging.error(f"Data dump file not found: {file_path}")
         return jsonify({'error': 'Data dump file not found.'}), 404
 
     logging.info(f"Received request for local arbitrage with timeframe={timeframe}, regions={regions}, bookmakers={selected_bookmakers}, filename={filename}")
 
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            logging.error("Data dump does not contain a list of matches.")
-            raise ValueError("Invalid data format in data dump.")
+        page_args = parse_arb_page_args(default_sort='profit')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        logging.info(f"Loaded {len(data)} matches from {filename}")
-
-        # Retrieve arbitrage opportunities from local data
-        arbitrage_opportunities = process_data(
-            matches=data,
-            include_started_matches=False,
-            selected_bookmakers=selected_bookmakers
+    try:
+        # Stored snapshots never change; legacy files are keyed on mtime so edits are picked up
+        cache_key = ('store', label) if in_store else ('file', file_path, os.path.getmtime(file_path))
+        now = datetime.now()
+
+        def compute():
+            index = local_index_cache.get(cache_key)
+            if index is None:
+                # Index the dump once, streaming it and skipping events that have already started;
+                # later bookmaker and timeframe changes are answered from the index
+                index = BookmakerSubsetIndex(iter_local_matches(label, file_path, in_store, now.timestamp()))
+                logging.info(f"Indexed {index.event_count} upcoming matches from {filename}")
+                local_index_cache.set(cache_key, index, LOCAL_INDEX_CACHE_TTL)
+            return index.query(
+                index.mask_for(selected_bookmakers),
+                include_started_matches=False,
+                current_time=now.timestamp(),
+                bounds=timeframe_bounds(timeframe, now)
+            )
+
+        # Retrieve arbitrage opportunities for the selected bookmakers within the timeframe, similar to live data,
+        # sorted and paginated server-side. Results are cached per dump version, bookmakers, timeframe and day;
+        # repeated requests for an unchanged dump are answered from the cache, or with 304
+        return arbs_response(
+            label if in_store else f"{label}.{int(cache_key[2] * 1000)}",
+            (timeframe, tuple(sorted(set(selected_bookmakers))), now.strftime('%Y-%m-%d')),
+            page_args,
+            compute,
+            ttl=lambda arbs: local_arbs_ttl(arbs, now)
         )
 
-        logging.info(f"Found {len(arbitrage_opportunities)} arbitrage opportunities in local data")
-
-        # Apply timeframe filtering similar to live data
-        current_time = datetime.now()
-
-        if timeframe == 'today':
-            start_time = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_time = current_time.replace(hour=23, minute=59, second=59, microsecond=999999)
-        elif timeframe == 'week':
-            start_time = current_time - timedelta(days=current_time.weekday())
-            end_time = start_time + timedelta(days=6)
-        elif timeframe == 'month':
-            start_time = current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            end_time = (start_time + timedelta(days=31)).replace(day=1) - timedelta(seconds=1)
-        else:
-            start_time = None
-            end_time = None
-
-        if start_time and end_time:
-            arbitrage_opportunities = [
-                arb for arb in arbitrage_opportunities
-                if start_time <= datetime.strptime(arb['date'], '%Y-%m-%d %H:%M:%S') <= end_time
-            ]
-            logging.info(f"After timeframe filtering: {len(arbitrage_opportunities)} arbitrage opportunities")
-
-        # Sort arbitrage opportunities by profit in descending order
-        arbitrage_opportunities.sort(key=lambda x: x['profit'], reverse=True)
-
     except FileNotFoundError:
         logging.error("Data dump file not found.")
         return jsonify({'error': 'Data dump file not found.'}), 500
@@ -462,8 +3113,6 @@ def get_local_arbitrage():
         logging.error(f"Error reading or processing local data: {e}")
         return jsonify({'error': 'Failed to read or process local data'}), 500
 
-    return jsonify({"arbs": arbitrage_opportunities})
-
 # API endpoint to retrieve available bookmakers for given regions
 @app.route('/api/bookmakers', methods=['GET'])
 def get_bookmakers():
@@ -511,4 +3160,18 @@ def index():
 
 # Run the Flask app on host 0.0.0.0 and port  
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == 'migrate_dumps':
+        # Import legacy JSON dumps into the snapshot store; pass --remove to delete them afterwards
+        count = migrate_json_dumps(snapshot_store, DATA_DUMPS_DIR, remove='--remove' in sys.argv[2:])
+        logging.info(f"Migrated {count} data dumps into {SNAPSHOT_DB_PATH}")
+    elif len(sys.argv) > 1 and sys.argv[1] == 'backtest':
+        run_backtest_cli(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'poller':
+        # Standalone poller process publishing snapshots for the web workers
+        if not API_KEY:
+            sys.exit("API key not found in environment variables.")
+        if not SNAPSHOT_FILE:
+            logging.warning("ODDS_SNAPSHOT_FILE is not set; web workers will not see this poller's snapshots.")
+        OddsPoller(API_KEY, map_regions(POLLER_REGIONS), snapshot_file=SNAPSHOT_FILE).run_forever()
+    else:
+        app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
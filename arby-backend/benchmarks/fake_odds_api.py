@@ -0,0 +1,153 @@
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from synthetic_odds import generate_odds
+
+# Local stand-in for the parts of the Odds API the backend calls: /v4/sports, /v4/sports/{sport}/odds
+# and /v4/sports/{sport}/events. Payloads are encoded once up front so the server adds little
+# overhead of its own. Latency (fixed plus seeded jitter) and 429 responses can be injected, and
+# quota headers are sent like the real API. Point the backend at it with ODDS_API_BASE_URL.
+class FakeOddsAPI:
+    def __init__(self, dataset: dict, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, rate_limit_every: int = 0, retry_after: int = 0,
+                 quota: int = 500_000, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_every = rate_limit_every  # Every Nth odds request gets a 429 (0 disables)
+        self.retry_after = retry_after
+        self.quota_remaining = quota
+        self.quota_used = 0
+        self.counts = {'sports': 0, 'odds': 0, 'events': 0, 'rate_limited': 0, 'not_found': 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._sports_body = json.dumps(dataset['sports']).encode()
+        self._odds_bodies = {sport: json.dumps(events).encode() for sport, events in dataset['odds'].items()}
+        self._events_bodies = {
+            sport: json.dumps([
+                {key: event[key] for key in ('id', 'sport_key', 'sport_title', 'commence_time', 'home_team', 'away_team')}
+                for event in events
+            ]).encode()
+            for sport, events in dataset['odds'].items()
+        }
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v4"
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, like the real API
+
+            def do_GET(self):
+                status, body, headers = api.respond(urlsplit(self.path).path)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    # Route a request path to (status, body, extra headers)
+    def respond(self, path: str):
+        parts = [part for part in path.split('/') if part]
+        if self.latency or self.jitter:
+            with self._lock:
+                delay = self.latency + self._rng.uniform(0, self.jitter)
+            time.sleep(delay)
+
+        if parts == ['v4', 'sports']:
+            with self._lock:
+                self.counts['sports'] += 1
+            return 200, self._sports_body, {}
+
+        if len(parts) == 4 and parts[:2] == ['v4', 'sports'] and parts[3] == 'events' and parts[2] in self._events_bodies:
+            with self._lock:
+                self.counts['events'] += 1
+            return 200, self._events_bodies[parts[2]], {}
+
+        if len(parts) == 4 and parts[:2] == ['v4', 'sports'] and parts[3] == 'odds' and parts[2] in self._odds_bodies:
+            with self._lock:
+                self.counts['odds'] += 1
+                if self.rate_limit_every and self.counts['odds'] % self.rate_limit_every == 0:
+                    self.counts['rate_limited'] += 1
+                    body = json.dumps({'message': 'Rate limit exceeded'}).encode()
+                    return 429, body, {'Retry-After': str(self.retry_after)}
+                # h2h for one region costs 1; the backend does not depend on the exact figure
+                self.quota_used += 1
+                self.quota_remaining = max(0, self.quota_remaining - 1)
+                headers = {
+                    'x-requests-remaining': str(self.quota_remaining),
+                    'x-requests-used': str(self.quota_used),
+                    'x-requests-last': '1',
+                }
+            return 200, self._odds_bodies[parts[2]], headers
+
+        with self._lock:
+            self.counts['not_found'] += 1
+        return 404, json.dumps({'message': 'Unknown endpoint'}).encode(), {}
+
+    def start(self) -> 'FakeOddsAPI':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-odds-api', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeOddsAPI':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve a synthetic dataset on a local stand-in for the Odds API.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--sports', type=int, default=10)
+    parser.add_argument('--events', type=int, default=20, help="Events per sport")
+    parser.add_argument('--bookmakers', type=int, default=12)
+    parser.add_argument('--outcomes', type=int, default=2)
+    parser.add_argument('--arb-density', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Up to this many extra seconds per response")
+    parser.add_argument('--rate-limit-every', type=int, default=0, help="Answer every Nth odds request with a 429")
+    parser.add_argument('--retry-after', type=int, default=0)
+    args = parser.parse_args()
+
+    # Events start within the coming week so the backend treats them as upcoming
+    dataset = generate_odds(args.sports, args.events, args.bookmakers, args.outcomes, args.arb_density,
+                            args.seed, start_time=int(time.time()))
+    api = FakeOddsAPI(dataset, args.host, args.port, args.latency, args.jitter, args.rate_limit_every,
+                      args.retry_after, seed=args.seed)
+    print(f"Serving {args.sports * args.events} events ({dataset['expected_arbs']} arbs) at {api.url}")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,222 @@
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from fake_odds_api import FakeOddsAPI
+from synthetic_odds import generate_odds
+
+# Benchmark harness for the arbitrage pipeline: normalization, the arbitrage engine and its
+# vectorized cross-check (vectorized_engine.py), the bookmaker subset index, end-to-end scans
+# against the local Odds API stand-in and the Flask endpoints. Reports throughput (events/s), p50/p99 latency and peak traced memory per benchmark
+# and compares them with the committed baselines. Arb counts must match exactly; timings and
+# memory may not exceed the baseline by more than --tolerance. Baselines are machine dependent:
+# refresh them with --update-baselines on the machine that runs --check.
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCHMARK_DIR)
+BASELINES_PATH = os.path.join(BENCHMARK_DIR, 'baselines.json')
+
+# Dataset sizes; each benchmark's throughput is measured over every event of the dataset
+SCALES = {
+    'small': {'sports': 5, 'events_per_sport': 40, 'bookmakers': 10, 'outcomes': 2, 'arb_density': 0.05},
+    'medium': {'sports': 20, 'events_per_sport': 100, 'bookmakers': 20, 'outcomes': 3, 'arb_density': 0.05},
+    'large': {'sports': 60, 'events_per_sport': 200, 'bookmakers': 30, 'outcomes': 3, 'arb_density': 0.05},
+}
+
+# Import the backend configured against the stand-in: no pacing limits, fast 429 backoff and a
+# throwaway snapshot store, so results measure the backend rather than its safety limits
+def load_app(base_url: str, work_dir: str):
+    os.environ.update({
+        'ODDS_API_BASE_URL': base_url,
+        'ODDS_API_KEY': 'benchmark',
+        'ODDS_API_RATE': '100000',
+        'ODDS_API_BURST': '1000',
+        'ODDS_API_BACKOFF_BASE': '0.01',
+        'ODDS_API_BACKOFF_CAP': '0.1',
+        'SNAPSHOT_DB_PATH': os.path.join(work_dir, 'snapshots.db'),
+        'SINGLE_FLIGHT_DIR': '',
+        'ODDS_POLLER': '0',
+        'ODDS_SNAPSHOT_FILE': '',
+    })
+    sys.path.insert(0, BACKEND_DIR)
+    import app
+    logging.getLogger().setLevel(logging.ERROR)
+    return app
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+# Time `iterations` runs after one warm-up run, then measure peak memory over one more traced run.
+# `fn` returns the number of arbs it found (None when the benchmark does not produce arbs).
+def measure(fn, events: int, iterations: int) -> dict:
+    fn()
+    samples = []
+    arbs = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        arbs = fn()
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'iterations': iterations,
+        'throughput': round(events * iterations / sum(samples), 1),
+        'p50_ms': round(percentile(samples, 50) * 1000, 3),
+        'p99_ms': round(percentile(samples, 99) * 1000, 3),
+        'peak_mem_mb': round(peak / (1024 * 1024), 3),
+        'arbs': arbs,
+    }
+
+# Benchmarks as (name, fn) pairs over the generated dataset served by `api`
+def build_benchmarks(app, dataset: dict, current_time: float) -> list:
+    from vectorized_engine import process_data_vectorized
+    raw_events = [event for events in dataset['odds'].values() for event in events]
+    matches = app.to_matches(raw_events)
+    titles = sorted({bookmaker.title for match in matches for bookmaker in match.bookmakers})
+    subset = titles[::2]  # A fixed half of the bookmakers
+    client = app.app.test_client()
+    headers = {'Accept-Encoding': 'gzip'}
+    label = app.snapshot_store.save_snapshot(matches, arbs=[], label='benchmark_dataset')
+
+    def normalize():
+        app.to_matches(raw_events)
+
+    def engine_python():
+        return len(app.process_data(matches, current_time=current_time))
+
+    def engine_numpy():
+        return len(process_data_vectorized(matches, current_time=current_time))
+
+    def subset_index_build():
+        app.BookmakerSubsetIndex(matches)
+
+    index = app.BookmakerSubsetIndex(matches)
+
+    def subset_index_query():
+        return len(index.query(index.mask_for(subset), current_time=current_time))
+
+    def scan_end_to_end():
+        app.response_cache.clear()
+        arbs, _ = app.get_arbitrage_opportunities(app.API_KEY, ['us'], [], 0, 'all')
+        return len(arbs)
+
+    def endpoint_arbitrage():
+        app.response_cache.clear()
+        response = client.get('/api/arbitrage?timeframe=all&regions=us', headers=headers)
+        return json.loads(app.gzip.decompress(response.data))['total']
+
+    def endpoint_local_arbitrage():
+        app.local_index_cache.clear()
+        app.arbs_response_cache.clear()
+        response = client.get(f'/api/local_arbitrage?timeframe=all&filename={label}', headers=headers)
+        return json.loads(app.gzip.decompress(response.data))['total']
+
+    return [
+        ('normalize', normalize),
+        ('engine_python', engine_python),
+        ('engine_numpy', engine_numpy),
+        ('subset_index_build', subset_index_build),
+        ('subset_index_query', subset_index_query),
+        ('scan_end_to_end', scan_end_to_end),
+        ('endpoint_arbitrage', endpoint_arbitrage),
+        ('endpoint_local_arbitrage', endpoint_local_arbitrage),
+    ]
+
+# Compare results with the baselines of the same scale; returns a list of failure messages
+def check_baselines(results: dict, baselines: dict, tolerance: float) -> list:
+    failures = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result['arbs'] != baseline['arbs']:
+            failures.append(f"{name}: found {result['arbs']} arbs, baseline {baseline['arbs']}")
+        for metric in ('p50_ms', 'peak_mem_mb'):
+            limit = baseline[metric] * (1 + tolerance)
+            if result[metric] > limit:
+                failures.append(f"{name}: {metric} {result[metric]} exceeds baseline {baseline[metric]} by more than {tolerance:.0%}")
+    return failures
+
+def print_results(results: dict, baselines: dict):
+    print(f"{'benchmark':<26}{'events/s':>12}{'p50 ms':>11}{'p99 ms':>11}{'peak MB':>10}{'arbs':>7}{'p50 vs base':>13}")
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        delta = f"{result['p50_ms'] / baseline['p50_ms'] - 1:+.1%}" if baseline and baseline['p50_ms'] else '-'
+        arbs = '-' if result['arbs'] is None else result['arbs']
+        print(f"{name:<26}{result['throughput']:>12}{result['p50_ms']:>11}{result['p99_ms']:>11}{result['peak_mem_mb']:>10}{arbs:>7}{delta:>13}")
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the arbitrage benchmarks on synthetic data.")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', help="Run only these benchmarks")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds the stand-in API adds to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Up to this many extra seconds per response")
+    parser.add_argument('--rate-limit-every', type=int, default=0, help="Stand-in answers every Nth odds request with a 429")
+    parser.add_argument('--check', action='store_true', help="Exit non-zero when results regress against the baselines")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="Allowed p50/memory growth over the baseline (0.5 = 50%%)")
+    parser.add_argument('--update-baselines', action='store_true', help="Store these results as the new baselines")
+    parser.add_argument('--json', help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    # Events start an hour from now so live scans treat every one of them as upcoming
+    current_time = int(time.time())
+    dataset = generate_odds(**SCALES[args.scale], seed=args.seed, start_time=current_time + 3600)
+    events = sum(len(events) for events in dataset['odds'].values())
+
+    baselines = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH, 'r') as f:
+            baselines = json.load(f)
+    scale_baselines = baselines.get(args.scale, {})
+
+    with tempfile.TemporaryDirectory() as work_dir, \
+            FakeOddsAPI(dataset, latency=args.latency, jitter=args.jitter, rate_limit_every=args.rate_limit_every, seed=args.seed) as api:
+        app = load_app(api.url, work_dir)
+        print(f"Scale {args.scale}: {events} events over {len(dataset['odds'])} sports, {dataset['expected_arbs']} arbs, {args.iterations} iterations")
+
+        results = {}
+        for name, fn in build_benchmarks(app, dataset, current_time):
+            if args.only and name not in args.only:
+                continue
+            results[name] = measure(fn, events, args.iterations)
+        print_results(results, scale_baselines)
+        print(f"Stand-in API requests: {api.counts}")
+
+    failures = []
+    for name in ('engine_python', 'engine_numpy', 'scan_end_to_end', 'endpoint_arbitrage', 'endpoint_local_arbitrage'):
+        if name in results and results[name]['arbs'] != dataset['expected_arbs']:
+            failures.append(f"{name}: found {results[name]['arbs']} arbs, dataset has {dataset['expected_arbs']}")
+    if args.check:
+        failures.extend(check_baselines(results, scale_baselines, args.tolerance))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'scale': args.scale, 'results': results}, f, indent=2)
+    if args.update_baselines:
+        baselines[args.scale] = {**scale_baselines, **results}
+        with open(BASELINES_PATH, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Updated {args.scale} baselines in {BASELINES_PATH}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
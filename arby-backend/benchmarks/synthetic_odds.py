@@ -0,0 +1,116 @@
+import argparse
+import json
+import random
+
+# Deterministic generator of Odds-API-shaped payloads for the benchmarks. The same arguments
+# always produce the same payloads, and only the events chosen as arbs can be arbs: every other
+# event is priced with a bookmaker margin larger than the price noise, while arb events get one
+# boosted quote per outcome that leaves a 1-4% edge over the fair probabilities.
+
+OUTCOME_NAMES = ['Home', 'Away', 'Draw']
+
+# Sport list in the shape of GET /v4/sports
+def generate_sports(sports: int) -> list:
+    return [
+        {
+            'key': f"synthetic_sport_{s:03d}",
+            'group': 'Synthetic',
+            'title': f"Synthetic Sport {s}",
+            'description': 'Generated for benchmarks',
+            'active': True,
+            'has_outrights': False,
+        }
+        for s in range(sports)
+    ]
+
+# One event in the shape of GET /v4/sports/{sport}/odds with decimal odds and unix dates
+def generate_event(rng: random.Random, sport: dict, index: int, bookmakers: list, outcomes: int,
+                   is_arb: bool, commence_time: int) -> dict:
+    home_team = f"{sport['title']} Team {2 * index}"
+    away_team = f"{sport['title']} Team {2 * index + 1}"
+    names = [home_team, away_team] + [OUTCOME_NAMES[k] if k < len(OUTCOME_NAMES) else f"Outcome {k}" for k in range(2, outcomes)]
+
+    # Fair probabilities of the outcomes
+    weights = [rng.uniform(0.5, 2.0) for _ in names]
+    total = sum(weights)
+    fair = [w / total for w in weights]
+
+    quoting = rng.sample(bookmakers, rng.randint(max(2, len(bookmakers) // 2), len(bookmakers)))
+    prices = []
+    for _ in quoting:
+        margin = rng.uniform(0.03, 0.08)
+        prices.append([max(1.01, round(rng.uniform(0.99, 1.01) / (p * (1 + margin)), 2)) for p in fair])
+
+    if is_arb:
+        edge = rng.uniform(0.01, 0.04)
+        for k, p in enumerate(fair):
+            b = rng.randrange(len(quoting))
+            prices[b][k] = round(1 / (p * (1 - edge)), 2)
+
+    last_update = commence_time - rng.randint(60, 3600)
+    return {
+        'id': f"{rng.getrandbits(128):032x}",
+        'sport_key': sport['key'],
+        'sport_title': sport['title'],
+        'commence_time': commence_time,
+        'home_team': home_team,
+        'away_team': away_team,
+        'bookmakers': [
+            {
+                'key': bookmaker['key'],
+                'title': bookmaker['title'],
+                'last_update': last_update,
+                'markets': [{
+                    'key': 'h2h',
+                    'last_update': last_update,
+                    'outcomes': [{'name': name, 'price': price} for name, price in zip(names, event_prices)]
+                }]
+            }
+            for bookmaker, event_prices in zip(quoting, prices)
+        ]
+    }
+
+# Generate a full dataset: {'sports': [...], 'odds': {sport_key: [events]}, 'expected_arbs': n}.
+# Events start between start_time and start_time + horizon seconds; arb_density is the
+# fraction of events that are arbs over all bookmakers.
+def generate_odds(sports: int = 10, events_per_sport: int = 20, bookmakers: int = 12, outcomes: int = 2,
+                  arb_density: float = 0.05, seed: int = 0, start_time: int = 1_700_000_000,
+                  horizon: int = 7 * 24 * 60 * 60) -> dict:
+    if outcomes < 2:
+        raise ValueError("Events need at least two outcomes.")
+    if bookmakers < 2:
+        raise ValueError("Arbs need at least two bookmakers.")
+
+    rng = random.Random(seed)
+    sport_list = generate_sports(sports)
+    bookmaker_list = [{'key': f"bookmaker_{b:02d}", 'title': f"Bookmaker {b}"} for b in range(bookmakers)]
+
+    odds = {}
+    expected_arbs = 0
+    for sport in sport_list:
+        events = []
+        for index in range(events_per_sport):
+            is_arb = rng.random() < arb_density
+            expected_arbs += is_arb
+            commence_time = start_time + rng.randint(60, horizon)
+            events.append(generate_event(rng, sport, index, bookmaker_list, outcomes, is_arb, commence_time))
+        odds[sport['key']] = events
+
+    return {'sports': sport_list, 'odds': odds, 'expected_arbs': expected_arbs}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Write a synthetic odds dataset as a JSON list of matches (a data dump).")
+    parser.add_argument('output')
+    parser.add_argument('--sports', type=int, default=10)
+    parser.add_argument('--events', type=int, default=20, help="Events per sport")
+    parser.add_argument('--bookmakers', type=int, default=12)
+    parser.add_argument('--outcomes', type=int, default=2)
+    parser.add_argument('--arb-density', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--start-time', type=int, default=1_700_000_000)
+    args = parser.parse_args()
+
+    dataset = generate_odds(args.sports, args.events, args.bookmakers, args.outcomes, args.arb_density, args.seed, args.start_time)
+    with open(args.output, 'w') as f:
+        json.dump([event for events in dataset['odds'].values() for event in events], f)
+    print(f"Wrote {args.sports * args.events} events ({dataset['expected_arbs']} arbs) to {args.output}")
@@ -0,0 +1,141 @@
+import time
+
+import numpy as np
+
+from app import BookmakerQuote, expand_markets, label_market, to_matches
+
+# Independent, array-based implementation of the arbitrage engine. It is not used by the backend:
+# the benchmarks run it next to app.process_data as a cross-check, and both must report the same
+# arbs. Import it after the backend is configured (run_benchmarks.load_app), since importing app
+# reads its configuration from the environment.
+
+# Pack matches into a dense (match x bookmaker x outcome) price array for the vectorized engine.
+# Applies the same eligibility rules as process_data; missing prices are NaN. Quotes go straight
+# from the normalized records into flat index/price lists in one pass, and a per-cell maximum
+# (numpy's ufunc.at) keeps the highest quote when a bookmaker lists an outcome twice.
+def pack_matches(matches: list, include_started_matches: bool = True, selected_bookmakers: list = None, current_time: float = None) -> dict:
+    if current_time is None:
+        current_time = time.time()
+
+    selected = set(selected_bookmakers) if selected_bookmakers else None
+    packed_matches = []
+    match_idx, bookmaker_idx, outcome_idx, values = [], [], [], []
+    num_bookmakers = num_outcomes = 0
+    for match in expand_markets(to_matches(matches)):
+        start_time = match.commence_time
+        if not include_started_matches and start_time < current_time:
+            continue
+
+        bookmakers = match.bookmakers
+        if len(bookmakers) < 2:
+            continue
+
+        # Outcome names come from every bookmaker, mirroring process_data's required outcomes
+        outcomes_set = {name for bookmaker in bookmakers for name, _ in bookmaker.outcomes}
+        if len(outcomes_set) < 2:
+            continue
+
+        required_outcomes = list(outcomes_set)
+        outcome_index = {name: k for k, name in enumerate(required_outcomes)}
+        m = len(packed_matches)
+        for b, bookmaker in enumerate(bookmakers):
+            if selected and bookmaker.title not in selected:
+                continue
+            for name, price in bookmaker.outcomes:
+                if price:
+                    match_idx.append(m)
+                    bookmaker_idx.append(b)
+                    outcome_idx.append(outcome_index[name])
+                    values.append(price)
+
+        packed_matches.append((match, start_time, required_outcomes))
+        num_bookmakers = max(num_bookmakers, len(bookmakers))
+        num_outcomes = max(num_outcomes, len(required_outcomes))
+
+    prices = np.full((len(packed_matches), num_bookmakers, num_outcomes), -np.inf)
+    if values:
+        np.maximum.at(prices, (match_idx, bookmaker_idx, outcome_idx), values)
+    prices[prices == -np.inf] = np.nan
+    outcome_mask = np.arange(num_outcomes) < np.array([len(m[2]) for m in packed_matches], dtype=np.intp).reshape(-1, 1)
+
+    return {
+        'matches': packed_matches,
+        'prices': prices,
+        'outcome_mask': outcome_mask,
+        'current_time': current_time,
+    }
+
+# Original quoted value of the highest price a bookmaker lists for an outcome, so ints stay ints
+def _quoted_price(bookmaker: BookmakerQuote, name: str):
+    best = None
+    for outcome_name, price in bookmaker.outcomes:
+        if outcome_name == name and price and (best is None or best < price):
+            best = price
+    return best
+
+# Vectorized alternative to process_data: one argmax reduction for best prices and
+# batch array math for implied probability, profit and stakes. Output is identical to process_data,
+# but packing is itself a Python pass over every quote, so it is not faster than the reference.
+def process_data_vectorized(matches: list, include_started_matches: bool = True, selected_bookmakers: list = None, current_time: float = None) -> list:
+    packed = pack_matches(matches, include_started_matches, selected_bookmakers, current_time)
+    packed_matches = packed['matches']
+    prices = packed['prices']
+    outcome_mask = packed['outcome_mask']
+    current_time = packed['current_time']
+
+    if not packed_matches or prices.shape[1] == 0:
+        return []
+
+    # Best price per outcome; argmax returns the first bookmaker on ties, matching process_data
+    filled = np.where(np.isnan(prices), -np.inf, prices)
+    best_bookmaker = filled.argmax(axis=1)
+    best_price = np.take_along_axis(filled, best_bookmaker[:, None, :], axis=1)[:, 0, :]
+
+    has_price = np.isfinite(best_price)
+    complete = np.all(has_price | ~outcome_mask, axis=1)
+    inverse = np.divide(1.0, best_price, out=np.zeros_like(best_price), where=has_price & outcome_mask)
+
+    # Sum outcome by outcome so the float result matches Python's left-to-right sum()
+    implied_probability = np.zeros(len(packed_matches))
+    for k in range(inverse.shape[1]):
+        implied_probability = implied_probability + inverse[:, k]
+
+    threshold = 1.0
+    epsilon = 1e-5
+    is_arb = complete & (implied_probability < (threshold - epsilon))
+    profit = (threshold - implied_probability) * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stake = inverse / implied_probability[:, None] * 100
+
+    arbs = []
+    for m in np.flatnonzero(is_arb):
+        match, start_time, required_outcomes = packed_matches[m]
+        event = match.event
+        sport_key = match.sport_key
+
+        odds_list = []
+        for k, outcome in enumerate(required_outcomes):
+            b = int(best_bookmaker[m, k])
+            bookmaker = match.bookmakers[b]
+            odds_list.append({
+                'team': outcome,
+                'price': _quoted_price(bookmaker, outcome),
+                'bookmaker': bookmaker.display_title,
+                'stake': round(float(stake[m, k]), 2),
+                'link': bookmaker.bet_link(sport_key, event)
+            })
+
+        arb = {
+            'sport': sport_key,
+            'event': event,
+            'date': match.date_str,
+            'profit': round(float(profit[m]), 2),
+            'is_live': start_time <= current_time and start_time != 0,
+            'odds': odds_list
+        }
+        if match.market != 'h2h':
+            label_market(arb, match.market, match.line, match.point_for)
+        arbs.append(arb)
+
+    arbs.sort(key=lambda x: x['profit'], reverse=True)
+    return arbs
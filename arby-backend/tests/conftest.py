@@ -0,0 +1,15 @@
+import os
+import sys
+import tempfile
+
+# app reads its configuration at import time: point it at a throwaway store and turn off the
+# background poller, the shared snapshot file and single-flight locks before any test imports it
+_work_dir = tempfile.mkdtemp(prefix='arby-tests-')
+os.environ.update({
+    'ODDS_API_KEY': 'test',
+    'SNAPSHOT_DB_PATH': os.path.join(_work_dir, 'snapshots.db'),
+    'SINGLE_FLIGHT_DIR': '',
+    'ODDS_POLLER': '0',
+    'ODDS_SNAPSHOT_FILE': '',
+})
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
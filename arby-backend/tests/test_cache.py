@@ -0,0 +1,22 @@
+import app
+
+def test_entry_cap_evicts_least_recently_used_entries():
+    cache = app.TTLCache(max_entries=2)
+    cache.set('a', 1, ttl=60)
+    cache.set('b', 2, ttl=60)
+    assert cache.get('a') == 1  # 'b' is now the least recently used
+    cache.set('c', 3, ttl=60)
+
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+def test_byte_cap_still_applies_without_an_entry_cap():
+    cache = app.TTLCache(max_bytes=10)
+    cache.set('a', 'x', ttl=60, size=6)
+    cache.set('b', 'y', ttl=60, size=6)
+    cache.set('big', 'z', ttl=60, size=11)  # Larger than the whole cache: never stored
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 'y'
+    assert cache.get('big') is None
@@ -0,0 +1,56 @@
+import io
+import json
+
+import pytest
+
+import app
+
+# Elements that are easy to cut in the wrong place: escapes and a surrogate pair, nested arrays,
+# non-ASCII text, bare numbers and literals
+DOCUMENT = json.dumps([
+    {'home_team': 'Quote \\" and \\\\ backslash', 'away_team': 'Tab\tand\nnewline', 'id': 'emoji \U0001F600'},
+    {'bookmakers': [[1, [2, [3]]], [], [[]]], 'sport_title': 'Ünïcödé Sport — 足球'},
+    12345.678e-2,
+    -7,
+    True,
+    None,
+    '',
+], ensure_ascii=True) + '\n'
+
+def decode(text: str, chunk_size: int) -> list:
+    return list(app.iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+
+# Every chunk size from one character up splits the document at every possible position
+@pytest.mark.parametrize('ensure_ascii', [True, False])
+def test_elements_split_across_chunk_boundaries_decode_unchanged(ensure_ascii):
+    text = DOCUMENT if ensure_ascii else json.dumps(json.loads(DOCUMENT), ensure_ascii=False, indent=1)
+    expected = json.loads(text)
+    for chunk_size in range(1, len(text) + 2):
+        assert decode(text, chunk_size) == expected, chunk_size
+
+@pytest.mark.parametrize('text', [' [ ] ', '[]', '\n[\n]\n'])
+def test_empty_arrays_yield_nothing(text):
+    assert decode(text, 1) == []
+
+@pytest.mark.parametrize('text', [
+    '',
+    '[',
+    '[{"id": 1}',
+    '[{"id": 1},',
+    '[{"id": 1}, {"id": ',
+    '[{"id": "unterminated',
+    '[12',
+])
+def test_truncated_documents_raise_decode_errors(text):
+    for chunk_size in (1, 3, 1 << 16):
+        with pytest.raises(json.JSONDecodeError):
+            decode(text, chunk_size)
+
+def test_missing_delimiter_raises_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        decode('[{"id": 1} {"id": 2}]', 4)
+
+@pytest.mark.parametrize('text', ['{"id": 1}', '"matches"', '42', 'null'])
+def test_non_array_documents_raise_value_error(text):
+    with pytest.raises(ValueError, match='does not contain a list'):
+        decode(text, 2)
@@ -0,0 +1,39 @@
+import json
+import os
+
+import app
+
+LAY_DUMP = os.path.join(app.DATA_DUMPS_DIR, 'data_dump_2024-10-06_15-48-49.json')
+
+def lay_quote_count(dump: list) -> int:
+    return sum(
+        market['key'].endswith('_lay')
+        for match in dump for bookmaker in match['bookmakers'] for market in bookmaker['markets']
+    )
+
+# The committed dump has exchange h2h_lay markets next to h2h; lay prices are not back bets and
+# must never be paired with each other as if they were a two-way line
+def test_replay_of_dump_with_lay_markets_finds_no_lay_arbs(tmp_path):
+    with open(LAY_DUMP, 'r') as f:
+        dump = json.load(f)
+    assert lay_quote_count(dump) > 0
+
+    store = app.SnapshotStore(str(tmp_path / 'lay.db'))
+    store.import_json_dump(LAY_DUMP)
+    lifetimes = app.replay_snapshots(store, include_started_matches=True, workers=1)
+
+    assert len(lifetimes) == 8  # Same arbs as the h2h-only engine found before line markets
+    assert all(lifetime['market'] == 'h2h' for lifetime in lifetimes)
+
+def test_lay_and_unknown_markets_are_dropped_at_normalization():
+    quote = app.BookmakerQuote.from_dict({
+        'key': 'betfair_ex_eu', 'title': 'Betfair', 'last_update': 1,
+        'markets': [
+            {'key': 'h2h', 'outcomes': [{'name': 'A', 'price': 2.0}, {'name': 'B', 'price': 1.9}]},
+            {'key': 'h2h_lay', 'outcomes': [{'name': 'A', 'price': 2.1}, {'name': 'B', 'price': 2.0}]},
+            {'key': 'outrights', 'outcomes': [{'name': 'A', 'price': 3.0}]},
+            {'key': 'totals', 'outcomes': [{'name': 'Over', 'price': 1.9, 'point': 2.5}]},
+        ],
+    })
+    assert [name for name, _ in quote.outcomes] == ['A', 'B']
+    assert [market for market, *_ in quote.lines] == ['totals']
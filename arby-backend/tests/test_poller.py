@@ -0,0 +1,48 @@
+import app
+
+from test_replay import COMMENCE, match, quote
+
+# Two refreshes within the persist interval save one snapshot; the first refresh after it saves another
+def test_poller_persists_refreshed_snapshots_throttled(tmp_path, monkeypatch):
+    store = app.SnapshotStore(str(tmp_path / 'poller.db'))
+    monkeypatch.setattr(app, 'snapshot_store', store)
+    monkeypatch.setattr(app, 'get_sports', lambda key: {'soccer_test'})
+    bookmakers = [quote('book_a', (2.1, 1.8), (1.9, 1.9)), quote('book_b', (1.8, 2.1), (1.9, 1.9))]
+    monkeypatch.setattr(app, 'fetch_odds_concurrently',
+                        lambda key, sports, regions, max_workers: [(sport, app.to_matches([match(bookmakers)])) for sport in sports])
+
+    poller = app.OddsPoller('test', ['eu'], persist_interval=300)
+    now = COMMENCE - 3 * 24 * 60 * 60
+    for offset in (0, 60, 301):
+        poller._next_refresh['soccer_test'] = now + offset
+        assert poller.poll_once(now=now + offset) == 1
+
+    snapshots = store.list_snapshots()
+    assert len(snapshots) == 2
+    assert all(snapshot['match_count'] == 1 and snapshot['arb_count'] == 1 for snapshot in snapshots)
+
+# Workers that map the writer's snapshot file serve the same arb diffs and poller status as the writer
+def test_arb_changes_and_status_are_served_from_the_shared_snapshot(tmp_path, monkeypatch):
+    snapshot_file = str(tmp_path / 'odds.snapshot')
+    monkeypatch.setattr(app, 'get_sports', lambda key: {'soccer_test'})
+    bookmakers = [quote('book_a', (2.1, 1.8), (1.9, 1.9)), quote('book_b', (1.8, 2.1), (1.9, 1.9))]
+    monkeypatch.setattr(app, 'fetch_odds_concurrently',
+                        lambda key, sports, regions, max_workers: [(sport, app.to_matches([match(bookmakers)])) for sport in sports])
+    poller = app.OddsPoller('test', ['eu'], snapshot_file=snapshot_file)
+    poller.poll_once(now=COMMENCE - 3 * 24 * 60 * 60)
+
+    # A worker without the in-process poller
+    monkeypatch.setattr(app, 'odds_poller', None)
+    monkeypatch.setattr(app, 'SNAPSHOT_FILE', snapshot_file)
+    monkeypatch.setattr(app, '_file_snapshot', None)
+    monkeypatch.setattr(app, '_file_snapshot_id', None)
+    client = app.app.test_client()
+
+    changes = client.get('/api/arb_changes').get_json()
+    assert [(diff['seq'], diff['type']) for diff in changes['changes']] == [(1, 'opened')]
+    assert changes['running']  # The writer (this process) is alive
+    assert client.get('/api/arb_changes?since=1').get_json()['changes'] == []
+
+    status = client.get('/api/poller_status').get_json()
+    assert status['version'] == 1
+    assert list(status['sports']) == ['soccer_test']
@@ -0,0 +1,49 @@
+import app
+
+COMMENCE = 1_800_000_000
+FETCHED = [COMMENCE - 3600 + 60 * i for i in range(4)]
+
+def quote(key: str, h2h: tuple, totals: tuple) -> dict:
+    return {
+        'key': key,
+        'title': key.title(),
+        'last_update': COMMENCE - 7200,
+        'markets': [
+            {'key': 'h2h', 'outcomes': [{'name': 'Home', 'price': h2h[0]}, {'name': 'Away', 'price': h2h[1]}]},
+            {'key': 'totals', 'outcomes': [
+                {'name': 'Over', 'price': totals[0], 'point': 2.5},
+                {'name': 'Under', 'price': totals[1], 'point': 2.5},
+            ]},
+        ],
+    }
+
+def match(bookmakers: list) -> dict:
+    return {
+        'id': 'event-1', 'sport_key': 'soccer_test', 'sport_title': 'Test', 'commence_time': COMMENCE,
+        'home_team': 'Home', 'away_team': 'Away', 'bookmakers': bookmakers,
+    }
+
+# A totals 2.5 arb open in three snapshots and closed in the fourth, next to an h2h arb on the
+# same event that stays open throughout
+def test_replay_reports_line_arbs_separately_from_h2h(tmp_path):
+    store = app.SnapshotStore(str(tmp_path / 'replay.db'))
+    open_line = [quote('book_a', (2.1, 1.8), (2.1, 1.8)), quote('book_b', (1.8, 2.1), (1.8, 2.1))]
+    closed_line = [quote('book_a', (2.1, 1.8), (1.8, 1.8)), quote('book_b', (1.8, 2.1), (1.8, 1.9))]
+    for i, fetched_at in enumerate(FETCHED):
+        store.save_snapshot([match(open_line if i < 3 else closed_line)], fetched_at=fetched_at, label=f"snapshot_{i}")
+
+    lifetimes = app.replay_snapshots(store, workers=2)
+
+    by_market = {(lifetime['market'], lifetime['point']): lifetime for lifetime in lifetimes}
+    assert sorted(by_market, key=str) == [('h2h', None), ('totals', 2.5)]
+
+    totals = by_market[('totals', 2.5)]
+    assert totals['event'] == 'Home vs. Away'
+    assert totals['observations'] == 3
+    assert totals['first_seen'] == FETCHED[0]
+    assert totals['closed_at'] == FETCHED[3]
+    assert totals['closed_by'] == ['Book_A', 'Book_B']
+
+    h2h = by_market[('h2h', None)]
+    assert h2h['observations'] == 4
+    assert h2h['closed_at'] is None
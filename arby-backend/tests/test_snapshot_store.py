@@ -0,0 +1,30 @@
+import threading
+
+import app
+
+from test_replay import match, quote
+
+# Separate SnapshotStore instances do not share the in-process write lock, like gunicorn workers
+# saving scans in the same second; every save must still get its own label
+def test_concurrent_stores_saving_in_the_same_second_get_distinct_labels(tmp_path):
+    path = str(tmp_path / 'shared.db')
+    stores = [app.SnapshotStore(path) for _ in range(4)]
+    matches = [match([quote('book_a', (2.1, 1.8), (1.9, 1.9)), quote('book_b', (1.8, 2.1), (1.9, 1.9))])]
+    labels, errors = [], []
+
+    def save(store):
+        try:
+            for _ in range(10):
+                labels.append(store.save_snapshot(matches, fetched_at=1_800_000_000))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(set(labels)) == 40
+    assert len(stores[0].list_snapshots()) == 40
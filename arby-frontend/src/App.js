@@ -153,37 +153,46 @@ function App() {
     setSelectedDataDump(event.target.value);
   };
 
-  // Fetch arbitrage data from the live API
-  const fetchArbitrageData = async () => {
+  // Stream arbitrage data from the live API; arbs are shown as soon as each sport is evaluated
+  const fetchArbitrageData = () => {
     setLoading(true);
     setError(null);
+    setArbitrageData([]);
 
-    try {
-      const params = new URLSearchParams();
-      params.append('timeframe', timeframe);
-      selectedRegions.forEach((region) => params.append('regions', region.toLowerCase()));
-      selectedBookmakers.forEach((bookmaker) => params.append('bookmakers', bookmaker));
+    const params = new URLSearchParams();
+    params.append('timeframe', timeframe);
+    selectedRegions.forEach((region) => params.append('regions', region.toLowerCase()));
+    selectedBookmakers.forEach((bookmaker) => params.append('bookmakers', bookmaker));
 
-      const response = await fetch(`${backendUrl}/api/arbitrage?${params.toString()}`);
-      if (!response.ok) {
-        const errorData = await response.json();
-        throw new Error(errorData.error || 'Failed to fetch arbitrage data.');
-      }
+    const eventSource = new EventSource(`${backendUrl}/api/arbitrage/stream?${params.toString()}`);
 
-      const data = await response.json();
-      if (data && data.arbs) {
-        setArbitrageData(data.arbs);
-        // Refresh data dumps after fetching new data
-        fetchDataDumps();
-      } else {
-        setArbitrageData([]);
-      }
-    } catch (err) {
-      console.error('Error fetching from backend:', err);
-      setError(err.message || 'Failed to fetch arbitrage data.');
-    } finally {
+    eventSource.addEventListener('arb', (event) => {
+      const arb = JSON.parse(event.data);
+      setArbitrageData((prevArbs) => [...prevArbs, arb]);
+    });
+
+    eventSource.addEventListener('summary', () => {
+      eventSource.close();
+      // Keep the final list ordered by match date, like the non-streaming endpoint
+      setArbitrageData((prevArbs) => [...prevArbs].sort((a, b) => a.date.localeCompare(b.date)));
       setLoading(false);
-    }
+      // Refresh data dumps after fetching new data
+      fetchDataDumps();
+    });
+
+    eventSource.addEventListener('scan_error', (event) => {
+      eventSource.close();
+      const errorData = JSON.parse(event.data);
+      setError(errorData.error || 'Failed to fetch arbitrage data.');
+      setLoading(false);
+    });
+
+    eventSource.onerror = (err) => {
+      console.error('Error streaming from backend:', err);
+      eventSource.close();
+      setError('Failed to fetch arbitrage data.');
+      setLoading(false);
+    };
   };
 
   // Fetch arbitrage data from the local file (via the backend)
@@ -425,13 +434,14 @@ function App() {
         )}
       </header>
       <main>
-        {loading && (
+        {loading && arbitrageData.length === 0 && (
           <Box display="flex" justifyContent="center" alignItems="center" minHeight="50vh">
             <CircularProgress />
           </Box>
         )}
 
-        {!loading && arbitrageData.length > 0 && (
+        {/* Streamed arbs are rendered as they arrive, while the scan is still running */}
+        {arbitrageData.length > 0 && (
           <Grid container spacing={4} className="arbitrage-list">
             {processedArbitrageData.map((match, index) => (
               <Grid item xs={12} md={6} key={index}>
@@ -476,6 +486,8 @@ function App() {
                                 <>
                                   <Typography variant="body1">
                                     <strong>{oddsInfo.team}</strong>
+                                    {oddsInfo.point != null &&
+                                      ` ${match.market === 'spreads' && oddsInfo.point > 0 ? '+' : ''}${oddsInfo.point}`}
                                   </Typography>
                                   <Typography variant="body2" color="textSecondary">
                                     Odds: {oddsInfo.price}